@@ -0,0 +1,136 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.shortcuts import get_object_or_404
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+from reviews.models import User
+
+USER_CLAIMS = ('username', 'role', 'is_staff', 'is_active')
+ISSUED_AT_CLAIM = 'iat'
+CLAIMS_USER_FLAG = 'from_token_claims'
+USER_NOT_FOUND_ERROR = 'Пользователь не найден'
+USER_INACTIVE_ERROR = 'Пользователь неактивен'
+
+
+def access_token_for_user(user):
+    token = AccessToken.for_user(user)
+    token[ISSUED_AT_CLAIM] = time.time()
+    for claim in USER_CLAIMS:
+        token[claim] = getattr(user, claim)
+    return token
+
+
+def get_full_user(user):
+    if getattr(user, CLAIMS_USER_FLAG, False):
+        return get_object_or_404(User, pk=user.pk)
+    return user
+
+
+def get_auth_cache():
+    return caches[settings.AUTH_CACHE_ALIAS]
+
+
+def user_changed_key(user_id):
+    return f'auth:user_changed:{user_id}'
+
+
+class UserCache:
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.users = OrderedDict()
+
+    def get(self, user_id, changed=None):
+        with self.lock:
+            cached = self.users.get(user_id)
+            if cached is None:
+                return None
+            expires, loaded, user = cached
+            if expires < time.monotonic() or (
+                changed is not None and loaded <= changed
+            ):
+                del self.users[user_id]
+                return None
+            self.users.move_to_end(user_id)
+            return copy.copy(user)
+
+    def set(self, user_id, user):
+        with self.lock:
+            self.users[user_id] = (
+                time.monotonic() + settings.AUTH_USER_CACHE_TTL,
+                time.time(), user
+            )
+            self.users.move_to_end(user_id)
+            while len(self.users) > settings.AUTH_USER_CACHE_SIZE:
+                self.users.popitem(last=False)
+
+    def forget(self, user_id):
+        with self.lock:
+            self.users.pop(user_id, None)
+
+    def clear(self):
+        with self.lock:
+            self.users.clear()
+
+
+user_cache = UserCache()
+
+
+def forget_user(user_id):
+    user_cache.forget(user_id)
+    get_auth_cache().set(
+        user_changed_key(user_id), time.time(),
+        api_settings.ACCESS_TOKEN_LIFETIME.total_seconds()
+    )
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None:
+            return super().get_user(validated_token)
+        changed = get_auth_cache().get(user_changed_key(user_id))
+        if self.has_fresh_claims(validated_token, changed):
+            user = self.user_from_claims(user_id, validated_token)
+        else:
+            user = self.user_from_database(user_id, changed)
+        if not user.is_active:
+            raise AuthenticationFailed(
+                USER_INACTIVE_ERROR, code='user_inactive'
+            )
+        return user
+
+    def user_from_database(self, user_id, changed):
+        user = user_cache.get(user_id, changed)
+        if user is None:
+            user = User.objects.filter(pk=user_id).first()
+            if user is None:
+                raise AuthenticationFailed(
+                    USER_NOT_FOUND_ERROR, code='user_not_found'
+                )
+            user_cache.set(user_id, copy.copy(user))
+        return user
+
+    def has_fresh_claims(self, validated_token, changed):
+        if not all(claim in validated_token for claim in USER_CLAIMS):
+            return False
+        issued = validated_token.get(ISSUED_AT_CLAIM)
+        return changed is None or (issued is not None and issued > changed)
+
+    def user_from_claims(self, user_id, validated_token):
+        user = User(
+            pk=user_id,
+            **{claim: validated_token[claim] for claim in USER_CLAIMS}
+        )
+        user._state.adding = False
+        user._state.db = 'default'
+        setattr(user, CLAIMS_USER_FLAG, True)
+        return user
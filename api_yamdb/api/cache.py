@@ -0,0 +1,139 @@
+import hashlib
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from rest_framework.response import Response
+
+CACHE_HEADER = 'X-Cache'
+HITS_KEY = 'catalogue:stats:hits'
+MISSES_KEY = 'catalogue:stats:misses'
+CATEGORIES = 'categories'
+GENRES = 'genres'
+TITLES = 'titles'
+
+
+def get_cache():
+    return caches[settings.CATALOGUE_CACHE_ALIAS]
+
+
+def title_generation(title_id):
+    return f'title:{title_id}'
+
+
+def generation_key(name):
+    return f'catalogue:generation:{name}'
+
+
+def new_generation():
+    return int(time.time() * 1000000)
+
+
+def get_generations(names):
+    cache = get_cache()
+    keys = [generation_key(name) for name in names]
+    generations = cache.get_many(keys)
+    for key in keys:
+        if key not in generations:
+            cache.add(key, new_generation(), None)
+            generations[key] = cache.get(key)
+    return [generations[key] for key in keys]
+
+
+def bump_generations(*names):
+    cache = get_cache()
+    for name in names:
+        key = generation_key(name)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, new_generation(), None)
+
+
+def bump_generations_on_commit(*names):
+    transaction.on_commit(lambda: bump_generations(*names))
+
+
+def lock_key(name):
+    return f'catalogue:lock:{name}'
+
+
+@contextmanager
+def single_flight(name, timeout):
+    cache = get_cache()
+    key = lock_key(name)
+    acquired = cache.add(key, True, timeout)
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            cache.delete(key)
+
+
+def count(key):
+    cache = get_cache()
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, None)
+        cache.incr(key)
+
+
+def get_stats():
+    cache = get_cache()
+    stats = cache.get_many((HITS_KEY, MISSES_KEY))
+    return {
+        'hits': stats.get(HITS_KEY, 0),
+        'misses': stats.get(MISSES_KEY, 0),
+    }
+
+
+def clear():
+    get_cache().clear()
+
+
+class CatalogueCacheMixin:
+    cache_generations = ()
+
+    def get_cache_generations(self):
+        return self.cache_generations
+
+    def get_cache_key(self, request):
+        generations = get_generations(self.get_cache_generations())
+        path = hashlib.md5(
+            request.build_absolute_uri().encode()
+        ).hexdigest()
+        generations = '.'.join(str(generation) for generation in generations)
+        return f'catalogue:response:{generations}:{path}'
+
+    def cached_response(self, view, request, *args, **kwargs):
+        cache = get_cache()
+        key = self.get_cache_key(request)
+        data = cache.get(key)
+        if data is not None:
+            count(HITS_KEY)
+            return Response(data, headers={CACHE_HEADER: 'HIT'})
+        count(MISSES_KEY)
+        response = view(request, *args, **kwargs)
+        cache.set(key, response.data, settings.CATALOGUE_CACHE_TIMEOUT)
+        response[CACHE_HEADER] = 'MISS'
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+
+class TitleCacheMixin(CatalogueCacheMixin):
+    cache_generations = (CATEGORIES, GENRES, TITLES)
+
+    def get_cache_generations(self):
+        if self.action == 'retrieve':
+            return (CATEGORIES, GENRES, title_generation(self.kwargs['pk']))
+        return super().get_cache_generations()
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(
+            super().retrieve, request, *args, **kwargs
+        )
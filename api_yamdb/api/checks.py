@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.core.checks import Error, register
+from rest_framework.settings import api_settings
+
+from .authentication import ClaimsJWTAuthentication
+
+PROCESS_LOCAL_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+AUTH_CACHE_ERROR = (
+    'Аутентификация по данным токена требует общего для всех процессов '
+    'кэша AUTH_CACHE_ALIAS'
+)
+
+
+@register()
+def check_auth_cache(app_configs, **kwargs):
+    if not any(
+        issubclass(authentication, ClaimsJWTAuthentication)
+        for authentication in api_settings.DEFAULT_AUTHENTICATION_CLASSES
+    ):
+        return []
+    backend = settings.CACHES.get(settings.AUTH_CACHE_ALIAS, {}).get(
+        'BACKEND'
+    )
+    if backend is None or backend in PROCESS_LOCAL_CACHE_BACKENDS:
+        return [Error(
+            AUTH_CACHE_ERROR,
+            hint='Используйте файловый кэш, кэш в базе данных или memcached',
+            id='api.E001',
+        )]
+    return []
@@ -0,0 +1,82 @@
+import calendar
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from .cache import get_generations
+
+
+class ConditionalGetMixin:
+
+    def get_validators(self):
+        return None, None
+
+    def conditional_response(self, view, request, *args, **kwargs):
+        state, modified = self.get_validators()
+        if state is None:
+            return view(request, *args, **kwargs)
+        etag = quote_etag(hashlib.md5(
+            f'{request.accepted_renderer.format}:{state}'.encode()
+        ).hexdigest())
+        last_modified = None
+        if modified is not None:
+            last_modified = calendar.timegm(modified.utctimetuple())
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is not None:
+            return response
+        response = view(request, *args, **kwargs)
+        if response.status_code == 200:
+            response['ETag'] = etag
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(last_modified)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(
+            super().list, request, *args, **kwargs
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(
+            super().retrieve, request, *args, **kwargs
+        )
+
+
+class GenerationConditionalGetMixin(ConditionalGetMixin):
+
+    def get_validators(self):
+        generations = get_generations(self.get_cache_generations())
+        return '.'.join(str(generation) for generation in generations), None
+
+
+class EditedConditionalGetMixin(ConditionalGetMixin):
+    conditional_model = None
+    conditional_lookups = None
+    conditional_edited = ('edited',)
+
+    def get_validators(self):
+        if self.conditional_model is None:
+            return None, None
+        queryset = self.conditional_model.objects.filter(**{
+            field: self.kwargs.get(kwarg)
+            for field, kwarg in self.conditional_lookups.items()
+        })
+        try:
+            if self.action == 'retrieve':
+                queryset = queryset.filter(pk=self.kwargs[self.lookup_field])
+            state = queryset.order_by().aggregate(count=Count('pk'), **{
+                field: Max(field) for field in self.conditional_edited
+            })
+        except (TypeError, ValueError):
+            return None, None
+        if not state['count']:
+            return None, None
+        edited = [state[field] for field in self.conditional_edited]
+        return (
+            ':'.join(str(value) for value in (state['count'], *edited)),
+            max(value for value in edited if value is not None)
+        )
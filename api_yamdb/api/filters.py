@@ -1,6 +1,8 @@
 from django_filters import (CharFilter, FilterSet, ModelMultipleChoiceFilter,
                             NumberFilter)
+from rest_framework.filters import OrderingFilter
 from reviews.models import Genre, Title
+from reviews.search import search_titles
 
 
 class TitleFilter(FilterSet):
@@ -15,7 +17,33 @@ class TitleFilter(FilterSet):
         queryset=Genre.objects.all()
     )
     year = NumberFilter(field_name='year')
+    search = CharFilter(method='filter_search')
 
     class Meta:
         model = Title
         fields = ('category', 'genre', 'year', 'name')
+
+    def filter_search(self, queryset, name, value):
+        return search_titles(queryset, value)
+
+
+class StableOrderingFilter(OrderingFilter):
+    tie_breaker = 'id'
+
+    def filter_queryset(self, request, queryset, view):
+        if self.get_ordering_param(request) is None and queryset.ordered:
+            return queryset
+        return super().filter_queryset(request, queryset, view)
+
+    def get_ordering_param(self, request):
+        return request.query_params.get(self.ordering_param)
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if not ordering:
+            return ordering
+        fields = [field.lstrip('-') for field in ordering]
+        if self.tie_breaker in fields or 'pk' in fields:
+            return ordering
+        direction = '-' if ordering[0].startswith('-') else ''
+        return (*ordering, f'{direction}{self.tie_breaker}')
@@ -0,0 +1,330 @@
+import json
+import random
+import statistics
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from api import cache
+from api.authentication import access_token_for_user
+from django.core.management import BaseCommand, CommandError, call_command
+from django.db import connection
+from django.test import Client
+from django.test.utils import (CaptureQueriesContext, setup_databases,
+                               setup_test_environment, teardown_databases,
+                               teardown_test_environment)
+from reviews.models import (ADMIN, Category, Comment, Genre, Review, Title,
+                            User)
+
+ALLOCATION_SAMPLES = 5
+METRICS = ('p50', 'p95', 'p99', 'queries', 'allocations')
+
+
+class Scenario:
+
+    def __init__(self, name, method, url, data=None, client='anonymous'):
+        self.name = name
+        self.method = method
+        self.url = url
+        self.data = data
+        self.client = client
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark api/v1 endpoints in-process on a seeded test database '
+        'and compare the results with a baseline'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=100)
+        parser.add_argument('--users', type=int, default=500)
+        parser.add_argument('--titles', type=int, default=2000)
+        parser.add_argument('--reviews', type=int, default=20000)
+        parser.add_argument('--comments', type=int, default=20000)
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument(
+            '--scenario', action='append',
+            help='Run only the named scenario, may be repeated'
+        )
+        parser.add_argument('--baseline', help='Baseline JSON file')
+        parser.add_argument(
+            '--save-baseline', action='store_true',
+            help='Write the results to the baseline file'
+        )
+        parser.add_argument(
+            '--threshold', type=float, default=0.2,
+            help='Allowed relative slowdown of p95 against the baseline'
+        )
+
+    def seed(self, options):
+        call_command(
+            'generate_data', seed=options['seed'], users=options['users'],
+            titles=options['titles'], reviews=options['reviews'],
+            comments=options['comments'], stdout=self.stdout
+        )
+        self.random = random.Random(options['seed'])
+        admin = User.objects.create(
+            username='benchmark_admin', email='benchmark_admin@yamdb.fake',
+            role=ADMIN
+        )
+        self.clients = {
+            'anonymous': Client(),
+            'admin': self.auth_client(admin),
+        }
+        title = Title.objects.order_by('-reviews_count').first()
+        review = Review.objects.filter(title=title).first()
+        author = User.objects.create(
+            username='benchmark_author', email='benchmark_author@yamdb.fake'
+        )
+        self.clients['author'] = self.auth_client(author)
+        self.context = {
+            'title': title.pk,
+            'review': review.pk,
+            'titles': list(Title.objects.values_list('id', flat=True)),
+            'genres': list(Genre.objects.values_list('slug', flat=True)),
+            'categories': list(
+                Category.objects.values_list('slug', flat=True)
+            ),
+            'reviewers': iter(self.create_users('reviewer', code=None)),
+            'signup': iter(range(self.requests)),
+            'token_users': self.create_users('token', code=1234),
+            'author_reviews': self.create_reviews(author),
+            'author_comments': iter([
+                Comment.objects.create(
+                    author=author, review=review, text='Комментарий'
+                )
+                for _ in range(self.requests + 1)
+            ]),
+        }
+        self.context['author_review'] = next(self.context['author_reviews'])
+        self.context['author_comment'] = next(
+            self.context['author_comments']
+        )
+
+    def create_users(self, prefix, code):
+        users = [
+            User.objects.create(
+                username=f'{prefix}{i}', email=f'{prefix}{i}@yamdb.fake',
+                code=code
+            )
+            for i in range(self.requests)
+        ]
+        return users
+
+    def create_reviews(self, author):
+        titles = Title.objects.order_by('id')[:self.requests + 1]
+        if len(titles) <= self.requests:
+            raise CommandError(
+                f'At least {self.requests + 1} titles are required'
+            )
+        return iter([
+            Review.objects.create(
+                author=author, title=title, text='Отзыв', score=5
+            )
+            for title in titles
+        ])
+
+    def auth_client(self, user):
+        token = access_token_for_user(user)
+        return Client(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def next_reviewer(self):
+        return self.auth_client(next(self.context['reviewers']))
+
+    def title_data(self):
+        return {
+            'name': 'Бенчмарк', 'year': 2000,
+            'genre': [self.random.choice(self.context['genres'])],
+            'category': self.random.choice(self.context['categories']),
+            'description': 'Описание',
+        }
+
+    def signup_data(self):
+        return {
+            'username': f'signup{next(self.context["signup"])}',
+            'email': f'signup{self.random.random()}@yamdb.fake',
+        }
+
+    def token_data(self):
+        return {
+            'username': self.random.choice(
+                self.context['token_users']
+            ).username,
+            'confirmation_code': '1234',
+        }
+
+    def review_url(self, review):
+        return f'/api/v1/titles/{review.title_id}/reviews/{review.pk}/'
+
+    def comment_url(self, comment):
+        return (
+            f'/api/v1/titles/{self.context["title"]}/reviews/'
+            f'{comment.review_id}/comments/{comment.pk}/'
+        )
+
+    def scenarios(self):
+        context = self.context
+        genres = context['genres']
+        title_url = f'/api/v1/titles/{context["title"]}/'
+        review_url = f'{title_url}reviews/{context["review"]}/'
+        return (
+            Scenario('titles-list', 'get', lambda: (
+                '/api/v1/titles/?offset='
+                f'{self.random.randrange(len(context["titles"]))}'
+            )),
+            Scenario('titles-filter', 'get', lambda: (
+                f'/api/v1/titles/?genre={self.random.choice(genres)}'
+                f'&year={self.random.randint(1900, 2022)}'
+            )),
+            Scenario('titles-search', 'get', lambda: (
+                f'/api/v1/titles/?search={self.random.choice(("мир", "дом"))}'
+                f'&offset={self.random.randrange(100)}'
+            )),
+            Scenario('title-detail', 'get', lambda: (
+                f'/api/v1/titles/{self.random.choice(context["titles"])}/'
+            )),
+            Scenario('title-create', 'post', lambda: '/api/v1/titles/',
+                     self.title_data, client='admin'),
+            Scenario('reviews-list', 'get', lambda: (
+                f'{title_url}reviews/?offset={self.random.randrange(100)}'
+            )),
+            Scenario('reviews-cursor', 'get', lambda: (
+                f'{title_url}reviews/?cursor='
+            )),
+            Scenario('review-create', 'post', lambda: f'{title_url}reviews/',
+                     lambda: {'text': 'Отзыв', 'score': 5},
+                     client=self.next_reviewer),
+            Scenario('review-update', 'patch', lambda: (
+                self.review_url(context['author_review'])
+            ), lambda: {'text': 'Изменённый отзыв'}, client='author'),
+            Scenario('review-delete', 'delete', lambda: (
+                self.review_url(next(context['author_reviews']))
+            ), client='author'),
+            Scenario('comments-list', 'get', lambda: f'{review_url}comments/'),
+            Scenario('comment-create', 'post',
+                     lambda: f'{review_url}comments/',
+                     lambda: {'text': 'Комментарий'}, client='admin'),
+            Scenario('comment-update', 'patch', lambda: (
+                self.comment_url(context['author_comment'])
+            ), lambda: {'text': 'Изменённый комментарий'}, client='author'),
+            Scenario('comment-delete', 'delete', lambda: (
+                self.comment_url(next(context['author_comments']))
+            ), client='author'),
+            Scenario('signup', 'post', lambda: '/api/v1/auth/signup/',
+                     self.signup_data),
+            Scenario('token', 'post', lambda: '/api/v1/auth/token/',
+                     self.token_data),
+        )
+
+    def request(self, scenario):
+        client = scenario.client
+        client = client() if callable(client) else self.clients[client]
+        data = scenario.data() if scenario.data else None
+        url = scenario.url()
+        kwargs = {}
+        if data is not None and scenario.method != 'post':
+            data = json.dumps(data)
+            kwargs['content_type'] = 'application/json'
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            response = getattr(client, scenario.method)(url, data, **kwargs)
+            elapsed = time.perf_counter() - started
+        if response.status_code >= 400:
+            raise CommandError(
+                f'{scenario.name}: {scenario.method.upper()} {url} '
+                f'returned {response.status_code}: {response.content[:200]}'
+            )
+        return elapsed, len(queries)
+
+    def measure(self, scenario):
+        self.request(scenario)
+        tracemalloc.start()
+        allocations = []
+        for _ in range(ALLOCATION_SAMPLES):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            self.request(scenario)
+            allocations.append(tracemalloc.get_traced_memory()[1] - before)
+        tracemalloc.stop()
+        timings = []
+        queries = []
+        for _ in range(self.iterations):
+            elapsed, count = self.request(scenario)
+            timings.append(elapsed * 1000)
+            queries.append(count)
+        percentiles = statistics.quantiles(timings, n=100)
+        return {
+            'p50': round(percentiles[49], 3),
+            'p95': round(percentiles[94], 3),
+            'p99': round(percentiles[98], 3),
+            'queries': max(queries),
+            'allocations': statistics.median(allocations),
+        }
+
+    def compare(self, results, baseline, threshold):
+        failures = []
+        for name, result in results.items():
+            expected = baseline.get(name)
+            if expected is None:
+                continue
+            if result['p95'] > expected['p95'] * (1 + threshold):
+                failures.append(
+                    f'{name}: p95 {result["p95"]}ms > '
+                    f'{expected["p95"]}ms baseline'
+                )
+            if result['queries'] > expected['queries']:
+                failures.append(
+                    f'{name}: {result["queries"]} queries > '
+                    f'{expected["queries"]} baseline'
+                )
+        return failures
+
+    def run(self, options):
+        self.seed(options)
+        results = {}
+        selected = options['scenario']
+        for scenario in self.scenarios():
+            if selected and scenario.name not in selected:
+                continue
+            cache.clear()
+            results[scenario.name] = result = self.measure(scenario)
+            self.stdout.write(
+                f'{scenario.name:16} ' + ' '.join(
+                    f'{metric}={result[metric]}' for metric in METRICS
+                )
+            )
+        return results
+
+    @contextmanager
+    def test_database(self):
+        setup_test_environment()
+        old_config = setup_databases(verbosity=0, interactive=False)
+        try:
+            yield
+        finally:
+            teardown_databases(old_config, verbosity=0)
+            teardown_test_environment()
+
+    def handle(self, *args, **options):
+        if options['iterations'] < 2:
+            raise CommandError('At least 2 iterations are required')
+        if options['save_baseline'] and not options['baseline']:
+            raise CommandError('--save-baseline requires --baseline')
+        self.iterations = options['iterations']
+        self.requests = self.iterations + ALLOCATION_SAMPLES + 1
+        with self.test_database():
+            results = self.run(options)
+        if not options['baseline']:
+            return
+        if options['save_baseline']:
+            with open(options['baseline'], 'w') as baseline_file:
+                json.dump(results, baseline_file, indent=2, sort_keys=True)
+            self.stdout.write(self.style.SUCCESS('Baseline saved'))
+            return
+        with open(options['baseline']) as baseline_file:
+            baseline = json.load(baseline_file)
+        failures = self.compare(results, baseline, options['threshold'])
+        if failures:
+            raise CommandError('Regressions found:\n' + '\n'.join(failures))
+        self.stdout.write(self.style.SUCCESS('No regressions found'))
@@ -0,0 +1,80 @@
+import random
+import timeit
+from datetime import datetime, timezone
+from io import BytesIO
+
+from api.parsers import FastJSONParser
+from api.renderers import FastJSONRenderer, orjson
+from django.core.management import BaseCommand
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from reviews.management.commands.generate_data import WORDS
+
+
+class Command(BaseCommand):
+    help = 'Compare JSON encode and decode time of the API renderers'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--titles', type=int, default=100)
+        parser.add_argument('--repeat', type=int, default=500)
+        parser.add_argument('--seed', type=int, default=42)
+
+    def text(self, words):
+        return ' '.join(self.random.choices(WORDS, k=words)).capitalize()
+
+    def page(self, count):
+        return {
+            'count': count,
+            'next': 'http://testserver/api/v1/titles/?limit=100&offset=100',
+            'previous': None,
+            'results': [
+                {
+                    'id': pk,
+                    'name': self.text(3),
+                    'year': self.random.randint(1900, 2022),
+                    'rating': self.random.choice((None, *range(1, 11))),
+                    'description': self.text(40),
+                    'genre': [
+                        {'name': self.text(1), 'slug': f'genre-{pk % 30}'}
+                        for _ in range(self.random.randint(1, 3))
+                    ],
+                    'category': {
+                        'name': self.text(1), 'slug': f'category-{pk % 10}'
+                    },
+                    'pub_date': datetime.now(timezone.utc),
+                }
+                for pk in range(1, count + 1)
+            ],
+        }
+
+    def measure(self, function, repeat):
+        return min(timeit.repeat(function, number=repeat, repeat=3)) / repeat
+
+    def report(self, name, baseline, fast):
+        self.stdout.write(
+            f'{name}: {baseline * 1e6:.1f}us -> {fast * 1e6:.1f}us '
+            f'({baseline / fast:.1f}x)'
+        )
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            self.stdout.write('orjson is not installed, using stdlib json')
+        self.random = random.Random(options['seed'])
+        data = self.page(options['titles'])
+        repeat = options['repeat']
+        renderer = JSONRenderer()
+        fast_renderer = FastJSONRenderer()
+        content = renderer.render(data)
+        self.report(
+            'encode',
+            self.measure(lambda: renderer.render(data), repeat),
+            self.measure(lambda: fast_renderer.render(data), repeat)
+        )
+        parser = JSONParser()
+        fast_parser = FastJSONParser()
+        self.report(
+            'decode',
+            self.measure(lambda: parser.parse(BytesIO(content)), repeat),
+            self.measure(lambda: fast_parser.parse(BytesIO(content)), repeat)
+        )
+        self.stdout.write(f'payload: {len(content)} bytes')
@@ -0,0 +1,22 @@
+from api import cache
+from django.core.management import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Show hit/miss counters of the catalogue cache or clear it'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--clear', action='store_true')
+
+    def handle(self, *args, **options):
+        if options['clear']:
+            cache.clear()
+            self.stdout.write(self.style.SUCCESS('Successfully cleared cache'))
+            return
+        stats = cache.get_stats()
+        total = stats['hits'] + stats['misses']
+        ratio = stats['hits'] / total if total else 0
+        self.stdout.write(
+            f'hits: {stats["hits"]}, misses: {stats["misses"]}, '
+            f'hit ratio: {ratio:.2%}'
+        )
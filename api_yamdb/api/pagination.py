@@ -0,0 +1,180 @@
+import hashlib
+from base64 import b64decode, b64encode
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.exceptions import EmptyResultSet
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from .cache import get_cache, get_generations
+
+INVALID_CURSOR_ERROR = 'Неверный курсор'
+COUNT_EXACT = 'exact'
+COUNT_CACHED = 'cached'
+COUNT_NONE = 'none'
+COUNT_MODES = (COUNT_EXACT, COUNT_CACHED, COUNT_NONE)
+
+
+class CountModeLimitOffsetPagination(LimitOffsetPagination):
+    count_query_param = 'count'
+    default_count_mode = COUNT_EXACT
+
+    def get_count_mode(self, request, view):
+        mode = request.query_params.get(self.count_query_param)
+        if mode in COUNT_MODES:
+            return mode
+        return getattr(view, 'pagination_count_mode', self.default_count_mode)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.view = view
+        self.count_mode = self.get_count_mode(request, view)
+        if self.count_mode != COUNT_NONE:
+            return super().paginate_queryset(queryset, request, view)
+        self.count = None
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+        self.offset = self.get_offset(request)
+        self.request = request
+        page = list(queryset[self.offset:self.offset + self.limit + 1])
+        self.has_next = len(page) > self.limit
+        return page[:self.limit]
+
+    def get_count(self, queryset):
+        if self.count_mode == COUNT_CACHED:
+            return self.get_cached_count(queryset)
+        return super().get_count(queryset)
+
+    def get_count_cache_key(self, queryset):
+        generations = ()
+        if hasattr(self.view, 'get_cache_generations'):
+            generations = get_generations(self.view.get_cache_generations())
+        state = f'{generations}:{queryset.query}'
+        return 'pagination:count:' + hashlib.md5(state.encode()).hexdigest()
+
+    def get_cached_count(self, queryset):
+        try:
+            key = self.get_count_cache_key(queryset)
+        except EmptyResultSet:
+            return 0
+        cache = get_cache()
+        count = cache.get(key)
+        if count is None:
+            count = super().get_count(queryset)
+            cache.set(key, count, settings.PAGINATION_COUNT_CACHE_TIMEOUT)
+        return count
+
+    def get_paginated_response(self, data):
+        if self.count is not None:
+            return super().get_paginated_response(data)
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data)
+        ]))
+
+    def get_next_link(self):
+        if self.count is not None:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        return replace_query_param(
+            url, self.offset_query_param, self.offset + self.limit
+        )
+
+
+class PubDateCursorPagination(CountModeLimitOffsetPagination):
+    cursor_query_param = 'cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.use_cursor = self.cursor_query_param in request.query_params
+        if not self.use_cursor:
+            return super().paginate_queryset(queryset, request, view)
+        self.request = request
+        self.limit = self.get_limit(request)
+        position, self.reverse = self.decode_cursor(request)
+        if self.reverse:
+            queryset = queryset.order_by('pub_date', 'id')
+            if position:
+                pub_date, pk = position
+                queryset = queryset.filter(
+                    Q(pub_date__gt=pub_date) | Q(pub_date=pub_date, id__gt=pk)
+                )
+        else:
+            queryset = queryset.order_by('-pub_date', '-id')
+            if position:
+                pub_date, pk = position
+                queryset = queryset.filter(
+                    Q(pub_date__lt=pub_date) | Q(pub_date=pub_date, id__lt=pk)
+                )
+        page = list(queryset[:self.limit + 1])
+        has_more = len(page) > self.limit
+        page = page[:self.limit]
+        if self.reverse:
+            page.reverse()
+            self.has_next = position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+        self.page = page
+        return page
+
+    def get_paginated_response(self, data):
+        if not self.use_cursor:
+            return super().get_paginated_response(data)
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data)
+        ]))
+
+    def get_next_link(self):
+        if not self.use_cursor:
+            return super().get_next_link()
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.use_cursor:
+            return super().get_previous_link()
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def encode_cursor(self, obj, reverse):
+        if isinstance(obj, dict):
+            pub_date, pk = obj['pub_date'], obj['id']
+        else:
+            pub_date, pk = obj.pub_date, obj.pk
+        position = f'{int(reverse)}|{pub_date.isoformat()}|{pk}'
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        return replace_query_param(
+            url, self.cursor_query_param,
+            b64encode(position.encode()).decode()
+        )
+
+    def decode_cursor(self, request):
+        cursor = request.query_params[self.cursor_query_param]
+        if not cursor:
+            return None, False
+        try:
+            reverse, pub_date, pk = b64decode(
+                cursor.encode(), validate=True
+            ).decode().split('|')
+            pub_date = parse_datetime(pub_date)
+            position = (pub_date, int(pk))
+        except (TypeError, ValueError):
+            raise NotFound(INVALID_CURSOR_ERROR)
+        if pub_date is None:
+            raise NotFound(INVALID_CURSOR_ERROR)
+        return position, reverse == '1'
@@ -17,11 +17,22 @@ class ReadOnly(permissions.BasePermission):
 
 class IsAdminOrModeratorOrAuthorOrReadOnly(permissions.BasePermission):
 
+    def has_permission(self, request, view):
+        return (
+            request.method in permissions.SAFE_METHODS
+            or request.user.is_authenticated
+        )
+
     def has_object_permission(self, request, view, obj):
         if request.method in permissions.SAFE_METHODS:
-            return request.method in permissions.SAFE_METHODS
-        if request.user.is_authenticated:
-            user = request.user
-            return (user.is_moderator
-                    or user.is_admin
-                    or obj.author == user)
+            return True
+        user = request.user
+        return (obj.author_id == user.pk
+                or user.is_moderator
+                or user.is_admin)
+
+    def filter_queryset(self, request, queryset):
+        user = request.user
+        if user.is_moderator or user.is_admin:
+            return queryset
+        return queryset.filter(author_id=user.pk)
@@ -0,0 +1,160 @@
+from collections import defaultdict
+
+from rest_framework import serializers
+from rest_framework.response import Response
+from reviews.models import SCORES, SCORE_FIELDS, Title, score_field_name
+
+from .sparse import requested_expansions, requested_fields
+from .timing import measure
+
+
+class FastReader:
+    columns = {}
+    expanded_columns = {}
+    optional_fields = ()
+    required_columns = ('id',)
+
+    def __init__(self, request):
+        selected = requested_fields(
+            request, self.columns, self.optional_fields
+        )
+        self.fields = [
+            name for name in self.columns
+            if selected is None or name in selected
+        ]
+        self.expand = requested_expansions(request, self.expanded_columns)
+
+    def get_columns(self, name):
+        if name in self.expand:
+            return self.expanded_columns[name]
+        return self.columns[name]
+
+    def values(self, queryset):
+        columns = list(self.required_columns)
+        for name in self.fields:
+            columns.extend(
+                column for column in self.get_columns(name)
+                if column not in columns
+            )
+        return queryset.select_related(None).prefetch_related(
+            None
+        ).values(*columns)
+
+    def serialize(self, rows):
+        return [self.to_representation(row) for row in rows]
+
+    def to_representation(self, row):
+        return {name: row[name] for name in self.fields}
+
+
+class TitleReader(FastReader):
+    columns = {
+        'id': ('id',),
+        'name': ('name',),
+        'year': ('year',),
+        'rating': ('rating',),
+        'description': ('description',),
+        'genre': (),
+        'category': ('category__name', 'category__slug'),
+        'score_distribution': SCORE_FIELDS,
+    }
+    optional_fields = ('score_distribution',)
+
+    def get_genres(self, rows):
+        genres = defaultdict(list)
+        for title_id, name, slug in Title.genre.through.objects.filter(
+            title_id__in=[row['id'] for row in rows]
+        ).order_by('genre__name').values_list(
+            'title_id', 'genre__name', 'genre__slug'
+        ):
+            genres[title_id].append({'name': name, 'slug': slug})
+        return genres
+
+    def serialize(self, rows):
+        self.genres = {}
+        if 'genre' in self.fields and rows:
+            self.genres = self.get_genres(rows)
+        return super().serialize(rows)
+
+    def to_representation(self, row):
+        data = {}
+        for name in self.fields:
+            if name == 'rating':
+                rating = row['rating']
+                data[name] = None if rating is None else int(rating)
+            elif name == 'genre':
+                data[name] = self.genres.get(row['id'], [])
+            elif name == 'category':
+                data[name] = None if row['category__slug'] is None else {
+                    'name': row['category__name'],
+                    'slug': row['category__slug'],
+                }
+            elif name == 'score_distribution':
+                data[name] = {
+                    str(score): row[score_field_name(score)]
+                    for score in SCORES
+                }
+            else:
+                data[name] = row[name]
+        return data
+
+
+class PublicationReader(FastReader):
+    expanded_columns = {'author': ('author__username', 'author__role')}
+    required_columns = ('id', 'pub_date')
+    datetime_field = serializers.DateTimeField()
+
+    def to_representation(self, row):
+        data = {}
+        for name in self.fields:
+            if name == 'author' and name in self.expand:
+                data[name] = {
+                    'username': row['author__username'],
+                    'role': row['author__role'],
+                }
+            elif name == 'author':
+                data[name] = row['author__username']
+            elif name == 'pub_date':
+                data[name] = self.datetime_field.to_representation(
+                    row['pub_date']
+                )
+            else:
+                data[name] = row[name]
+        return data
+
+
+class ReviewReader(PublicationReader):
+    columns = {
+        'id': ('id',),
+        'text': ('text',),
+        'author': ('author__username',),
+        'score': ('score',),
+        'pub_date': ('pub_date',),
+    }
+
+
+class CommentReader(PublicationReader):
+    columns = {
+        'id': ('id',),
+        'text': ('text',),
+        'author': ('author__username',),
+        'pub_date': ('pub_date',),
+    }
+
+
+class FastReadMixin:
+    reader_class = None
+
+    def list(self, request, *args, **kwargs):
+        if self.reader_class is None:
+            return super().list(request, *args, **kwargs)
+        reader = self.reader_class(request)
+        queryset = self.filter_queryset(self.get_queryset())
+        values = reader.values(queryset)
+        page = self.paginate_queryset(values)
+        rows = values if page is None else page
+        with measure(request, 'serialize'):
+            data = reader.serialize(list(rows))
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
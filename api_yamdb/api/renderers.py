@@ -0,0 +1,68 @@
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+LINE_SEPARATORS_PREFIX = b'\xe2'
+LINE_SEPARATORS = (
+    ('\u2028'.encode(), b'\\u2028'),
+    ('\u2029'.encode(), b'\\u2029'),
+)
+JSON_SCALARS = (str, int, bool, type(None))
+
+
+def contains_float(data):
+    containers = [(data,)]
+    while containers:
+        container = containers.pop()
+        if isinstance(container, dict):
+            container = container.values()
+        for value in container:
+            kind = type(value)
+            if kind in JSON_SCALARS:
+                continue
+            if isinstance(value, float):
+                return True
+            if isinstance(value, (dict, list, tuple)):
+                containers.append(value)
+    return False
+
+
+class FastJSONRenderer(JSONRenderer):
+
+    def get_default(self):
+        encode = self.encoder_class().default
+
+        def default(obj):
+            value = encode(obj)
+            if isinstance(value, float):
+                raise TypeError(f'{obj!r} is encoded as float')
+            return value
+        return default
+
+    def can_use_orjson(self, indent):
+        return (
+            orjson is not None and indent is None and self.compact
+            and not self.ensure_ascii
+        )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if (
+            data is None or not self.can_use_orjson(indent)
+            or contains_float(data)
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(
+                data, default=self.get_default(),
+                option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        if LINE_SEPARATORS_PREFIX in ret:
+            for separator, escaped in LINE_SEPARATORS:
+                ret = ret.replace(separator, escaped)
+        return ret
@@ -1,11 +1,17 @@
 import datetime
 import re
 
+from django.conf import settings
 from django.core.validators import MaxValueValidator, MinValueValidator
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
+from rest_framework.settings import api_settings
 from reviews.models import (Category, Comment, Genre, Review, Title, User,
                             username_validator)
 
+from .sparse import (ExpandableFieldsSerializerMixin,
+                     SparseFieldsSerializerMixin)
+
 USERNAME_ME_ERROR = 'Username указан неверно! Нельзя указать username "me"'
 INVALID_CHARACTER_ERR = ('Username указан неверно!'
                          'Можно использовать только латинские буквы,'
@@ -15,6 +21,12 @@ DOUBLE_USERNAME_ERROR = ('Указанный username используется 
 DOUBLE_EMAIL_ERROR = ('Указанный email используется с другим'
                       'именем пользователя')
 SCORE_ERROR = 'Оценкой может быть целое число от 1 до 10'
+SLUG_NOT_FOUND_ERROR = 'Не найдены объекты со slug: {}'
+DOUBLE_TITLE_ERROR = ('Произведение с таким названием и годом '
+                      'уже есть в запросе')
+BULK_SIZE_ERROR = 'Можно передать не больше {} произведений за раз'
+BULK_DELETE_SIZE_ERROR = 'Можно удалить не больше {} объектов за раз'
+UPSERT_OPTIONAL_FIELDS = ('description',)
 REGEX = re.compile(r'^[\w.@+-]+\Z')
 
 
@@ -76,6 +88,39 @@ class GenreSerializer(serializers.ModelSerializer):
         lookup_slug = 'slug'
 
 
+class GenreStatsSerializer(serializers.ModelSerializer):
+    titles_count = serializers.IntegerField(
+        source='stats.titles_count', read_only=True
+    )
+    reviews_count = serializers.IntegerField(
+        source='stats.reviews_count', read_only=True
+    )
+    rating = serializers.FloatField(source='stats.rating', read_only=True)
+    refreshed = serializers.DateTimeField(
+        source='stats.refreshed', read_only=True
+    )
+
+    class Meta:
+        model = Genre
+        fields = (
+            'name', 'slug', 'titles_count', 'reviews_count', 'rating',
+            'refreshed'
+        )
+        read_only_fields = fields
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if not hasattr(instance, 'stats'):
+            data.update(titles_count=0, reviews_count=0)
+        return data
+
+
+class CategoryStatsSerializer(GenreStatsSerializer):
+
+    class Meta(GenreStatsSerializer.Meta):
+        model = Category
+
+
 class TitleSeraializer(serializers.ModelSerializer):
     year = serializers.IntegerField(
         validators=[MaxValueValidator(current_year)]
@@ -93,20 +138,174 @@ class TitleSeraializer(serializers.ModelSerializer):
                   'description', 'genre', 'category')
 
 
-class ReadOnlyTitleSerializer(serializers.ModelSerializer):
+class TitleBulkListSerializer(serializers.ListSerializer):
+
+    def to_internal_value(self, data):
+        max_size = settings.TITLES_BULK_MAX_SIZE
+        if isinstance(data, list) and len(data) > max_size:
+            raise serializers.ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [
+                    BULK_SIZE_ERROR.format(max_size)
+                ]
+            })
+        items = super().to_internal_value(data)
+        genres = dict(Genre.objects.filter(
+            slug__in={slug for item in items for slug in item['genre']}
+        ).values_list('slug', 'id'))
+        categories = dict(Category.objects.filter(
+            slug__in={item['category'] for item in items}
+        ).values_list('slug', 'id'))
+        errors = []
+        keys = set()
+        for item in items:
+            item_errors = {}
+            missing = [slug for slug in item['genre'] if slug not in genres]
+            if missing:
+                item_errors['genre'] = [
+                    SLUG_NOT_FOUND_ERROR.format(', '.join(missing))
+                ]
+            if item['category'] not in categories:
+                item_errors['category'] = [
+                    SLUG_NOT_FOUND_ERROR.format(item['category'])
+                ]
+            key = (item['name'], item['year'])
+            if key in keys:
+                item_errors['name'] = [DOUBLE_TITLE_ERROR]
+            keys.add(key)
+            errors.append(item_errors)
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        for item in items:
+            item['genre'] = list(dict.fromkeys(
+                genres[slug] for slug in item['genre']
+            ))
+            item['category'] = categories[item['category']]
+        return items
+
+    def get_ids(self, keys, ordering, **filters):
+        ids = {}
+        for pk, name, year in Title.objects.filter(
+            name__in={name for name, _ in keys},
+            year__in={year for _, year in keys},
+            **filters
+        ).order_by(ordering).values_list('id', 'name', 'year'):
+            if (name, year) in keys:
+                ids[(name, year)] = pk
+        return ids
+
+    def get_update_groups(self, titles, validated_data):
+        groups = {}
+        for title, item in zip(titles, validated_data):
+            if title.bulk_created:
+                continue
+            fields = ('category',) + tuple(
+                field for field in UPSERT_OPTIONAL_FIELDS if field in item
+            )
+            groups.setdefault(fields, []).append(title)
+        return groups
+
+    def create(self, validated_data):
+        keys = {(item['name'], item['year']) for item in validated_data}
+        existing = self.get_ids(keys, '-id')
+        titles = []
+        for item in validated_data:
+            title = Title(
+                id=existing.get((item['name'], item['year'])),
+                name=item['name'],
+                year=item['year'],
+                description=item.get('description'),
+                category_id=item['category']
+            )
+            title.bulk_created = title.pk is None
+            titles.append(title)
+        new_titles = [title for title in titles if title.bulk_created]
+        old_titles = [title for title in titles if not title.bulk_created]
+        through = Title.genre.through
+        with transaction.atomic():
+            last_id = Title.objects.order_by('-id').values_list(
+                'id', flat=True
+            ).first() or 0
+            Title.objects.bulk_create(new_titles)
+            if new_titles and new_titles[0].pk is None:
+                ids = self.get_ids(
+                    keys - existing.keys(), 'id', id__gt=last_id
+                )
+                for title in new_titles:
+                    title.pk = ids[(title.name, title.year)]
+            for fields, group in self.get_update_groups(
+                titles, validated_data
+            ).items():
+                Title.objects.bulk_update(group, fields)
+            if old_titles:
+                through.objects.filter(
+                    title_id__in=[title.pk for title in old_titles]
+                ).delete()
+            through.objects.bulk_create([
+                through(title_id=title.pk, genre_id=genre_id)
+                for title, item in zip(titles, validated_data)
+                for genre_id in item['genre']
+            ])
+        return titles
+
+
+class TitleBulkSerializer(serializers.ModelSerializer):
+    year = serializers.IntegerField(
+        validators=[MaxValueValidator(current_year)]
+    )
+    genre = serializers.ListField(
+        child=serializers.SlugField(), write_only=True
+    )
+    category = serializers.SlugField(write_only=True)
+    created = serializers.BooleanField(source='bulk_created', read_only=True)
+
+    class Meta:
+        model = Title
+        fields = (
+            'id', 'name', 'year', 'description', 'genre', 'category',
+            'created'
+        )
+        extra_kwargs = {'description': {'write_only': True}}
+        list_serializer_class = TitleBulkListSerializer
+
+
+class ReadOnlyTitleSerializer(SparseFieldsSerializerMixin,
+                              serializers.ModelSerializer):
     genre = GenreSerializer(many=True)
     category = CategorySerializer()
-    rating = serializers.IntegerField()
+    rating = serializers.IntegerField(read_only=True)
+    score_distribution = serializers.DictField(
+        child=serializers.IntegerField(), read_only=True
+    )
+    optional_fields = ('score_distribution',)
 
     class Meta:
         model = Title
         fields = (
-            'id', 'name', 'year', 'rating', 'description', 'genre', 'category'
+            'id', 'name', 'year', 'rating', 'description', 'genre',
+            'category', 'score_distribution'
         )
         read_only_fields = ('__all__',)
 
 
-class ReviewSerializer(serializers.ModelSerializer):
+class TopTitleSerializer(ReadOnlyTitleSerializer):
+    weighted_rating = serializers.FloatField(
+        source='ranking.weighted_rating', read_only=True
+    )
+
+    class Meta(ReadOnlyTitleSerializer.Meta):
+        fields = (*ReadOnlyTitleSerializer.Meta.fields, 'weighted_rating')
+
+
+class AuthorSerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = User
+        fields = ('username', 'role')
+
+
+class ReviewSerializer(SparseFieldsSerializerMixin,
+                       ExpandableFieldsSerializerMixin,
+                       serializers.ModelSerializer):
     author = serializers.SlugRelatedField(
         slug_field='username', read_only=True,
         default=serializers.CurrentUserDefault()
@@ -114,30 +313,51 @@ class ReviewSerializer(serializers.ModelSerializer):
     score = serializers.IntegerField(validators=[MaxValueValidator(10),
                                                  MinValueValidator(1)])
 
+    expandable_fields = {'author': AuthorSerializer}
+
     class Meta:
         model = Review
         fields = ('id', 'text', 'author', 'score', 'pub_date')
 
-    def validate(self, data):
-        if self.context['request'].method != 'POST':
-            return data
-        my_view = self.context['view']
-        title = my_view.kwargs.get('title_id')
-        author = self.context['request'].user
-        if Review.objects.filter(title=title, author=author).exists():
-            raise serializers.ValidationError(
-                DOUBLE_REVIEW_ERROR
-            )
-        return data
-
-
-class CommentSerializer(serializers.ModelSerializer):
+    def create(self, validated_data):
+        try:
+            return super().create(validated_data)
+        except IntegrityError:
+            if not Review.objects.filter(
+                title_id=validated_data['title_id'],
+                author=validated_data['author']
+            ).exists():
+                raise
+            raise serializers.ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [DOUBLE_REVIEW_ERROR]
+            })
+
+
+class CommentSerializer(SparseFieldsSerializerMixin,
+                        ExpandableFieldsSerializerMixin,
+                        serializers.ModelSerializer):
     author = serializers.SlugRelatedField(
         slug_field='username',
         default=serializers.CurrentUserDefault(),
         read_only=True
     )
 
+    expandable_fields = {'author': AuthorSerializer}
+
     class Meta:
         model = Comment
         fields = ('id', 'text', 'author', 'pub_date')
+
+
+class BulkDeleteSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False
+    )
+
+    def validate_ids(self, value):
+        max_size = settings.BULK_DELETE_MAX_SIZE
+        if len(value) > max_size:
+            raise serializers.ValidationError(
+                BULK_DELETE_SIZE_ERROR.format(max_size)
+            )
+        return value
@@ -0,0 +1,62 @@
+from django.db.models.signals import (m2m_changed, post_delete, post_migrate,
+                                      post_save)
+from django.dispatch import receiver
+from reviews.models import Category, Genre, Review, Title, User
+
+from . import cache
+from .authentication import forget_user, user_cache
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_categories(sender, **kwargs):
+    cache.bump_generations_on_commit(cache.CATEGORIES)
+
+
+@receiver(post_save, sender=Genre)
+@receiver(post_delete, sender=Genre)
+def invalidate_genres(sender, **kwargs):
+    cache.bump_generations_on_commit(cache.GENRES)
+
+
+@receiver(post_save, sender=Title)
+@receiver(post_delete, sender=Title)
+def invalidate_title(sender, instance, **kwargs):
+    cache.bump_generations_on_commit(
+        cache.TITLES, cache.title_generation(instance.pk)
+    )
+
+
+@receiver(m2m_changed, sender=Title.genre.through)
+def invalidate_title_genres(sender, instance, action, reverse, pk_set,
+                            **kwargs):
+    if not action.startswith('post_'):
+        return
+    if reverse:
+        titles = pk_set or ()
+    else:
+        titles = (instance.pk,)
+    cache.bump_generations_on_commit(
+        cache.TITLES, *(cache.title_generation(pk) for pk in titles)
+    )
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def invalidate_review_title(sender, instance, **kwargs):
+    cache.bump_generations_on_commit(
+        cache.TITLES, cache.title_generation(instance.title_id)
+    )
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user(sender, instance, **kwargs):
+    forget_user(instance.pk)
+
+
+@receiver(post_migrate)
+def clear_catalogue_cache(sender, **kwargs):
+    if sender.label == 'api':
+        cache.clear()
+        user_cache.clear()
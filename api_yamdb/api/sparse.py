@@ -0,0 +1,97 @@
+from rest_framework.permissions import SAFE_METHODS
+
+FIELDS_PARAM = 'fields'
+OMIT_PARAM = 'omit'
+EXPAND_PARAM = 'expand'
+
+
+def parse_fields(value):
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+
+def requested_fields(request, available, optional=()):
+    if request is None or request.method not in SAFE_METHODS:
+        return None
+    fields = request.query_params.get(FIELDS_PARAM)
+    omit = request.query_params.get(OMIT_PARAM)
+    if fields is None and omit is None and not optional:
+        return None
+    if fields is None:
+        selected = set(available).difference(optional)
+    else:
+        selected = set(parse_fields(fields))
+    return selected.intersection(available).difference(
+        parse_fields(omit or '')
+    )
+
+
+def requested_expansions(request, available):
+    if request is None:
+        return set()
+    return set(parse_fields(
+        request.query_params.get(EXPAND_PARAM, '')
+    )).intersection(available)
+
+
+class SparseFieldsSerializerMixin:
+    optional_fields = ()
+
+    def get_fields(self):
+        fields = super().get_fields()
+        selected = requested_fields(
+            self.context.get('request'), fields, self.optional_fields
+        )
+        if selected is None:
+            return fields
+        return {
+            name: field for name, field in fields.items() if name in selected
+        }
+
+
+class ExpandableFieldsSerializerMixin:
+    expandable_fields = {}
+
+    def get_fields(self):
+        fields = super().get_fields()
+        for name in requested_expansions(
+            self.context.get('request'), self.expandable_fields
+        ):
+            if name in fields:
+                fields[name] = self.expandable_fields[name](read_only=True)
+        return fields
+
+
+class SparseFieldsetMixin:
+    sparse_columns = {}
+    sparse_optional_fields = ()
+    sparse_required_columns = ()
+    sparse_select_related = {}
+    sparse_prefetch_related = {}
+
+    def get_sparse_fields(self):
+        return requested_fields(
+            self.request, self.sparse_columns, self.sparse_optional_fields
+        )
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        fields = self.get_sparse_fields()
+        if fields is None:
+            return queryset
+        columns = ['id', *self.sparse_required_columns]
+        for name in fields:
+            columns.extend(self.sparse_columns[name])
+        queryset = queryset.select_related(None).prefetch_related(None)
+        select_related = [
+            self.sparse_select_related[name] for name in fields
+            if name in self.sparse_select_related
+        ]
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        prefetch_related = [
+            self.sparse_prefetch_related[name] for name in fields
+            if name in self.sparse_prefetch_related
+        ]
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        return queryset.only(*columns)
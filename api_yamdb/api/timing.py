@@ -0,0 +1,130 @@
+import json
+import logging
+import random
+import time
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager, nullcontext
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+TIMER_ATTRIBUTE = 'server_timing'
+
+
+class RequestTimer:
+
+    def __init__(self):
+        self.durations = defaultdict(float)
+        self.active = set()
+        self.queries = 0
+
+    @contextmanager
+    def measure(self, name):
+        if name in self.active:
+            yield
+            return
+        self.active.add(name)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[name] += time.perf_counter() - started
+            self.active.discard(name)
+
+    def timed(self, name, function):
+        def wrapper(*args, **kwargs):
+            with self.measure(name):
+                return function(*args, **kwargs)
+        return wrapper
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries += 1
+        with self.measure('db'):
+            return execute(sql, params, many, context)
+
+    def header(self):
+        metrics = [f'db;desc="{self.queries} queries"'
+                   f';dur={self.durations["db"] * 1000:.2f}']
+        metrics.extend(
+            f'{name};dur={duration * 1000:.2f}'
+            for name, duration in self.durations.items() if name != 'db'
+        )
+        return ', '.join(metrics)
+
+    def as_dict(self):
+        data = {
+            f'{name}_ms': round(duration * 1000, 2)
+            for name, duration in self.durations.items()
+        }
+        data['queries'] = self.queries
+        return data
+
+
+def get_timer(request):
+    return getattr(request, TIMER_ATTRIBUTE, None)
+
+
+def measure(request, name):
+    timer = get_timer(request)
+    if timer is None:
+        return nullcontext()
+    return timer.measure(name)
+
+
+class ServerTimingMiddleware:
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def sampled(self):
+        return (
+            settings.SERVER_TIMING_ENABLED
+            and random.random() < settings.SERVER_TIMING_SAMPLE_RATE
+        )
+
+    def __call__(self, request):
+        if not self.sampled():
+            return self.get_response(request)
+        timer = RequestTimer()
+        setattr(request, TIMER_ATTRIBUTE, timer)
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(timer))
+            with timer.measure('total'):
+                response = self.get_response(request)
+        response['Server-Timing'] = timer.header()
+        logger.info(json.dumps({
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            **timer.as_dict(),
+        }))
+        return response
+
+    def process_template_response(self, request, response):
+        timer = get_timer(request)
+        if timer is not None:
+            response.render = timer.timed('render', response.render)
+        return response
+
+
+class ServerTimingMixin:
+
+    def dispatch(self, request, *args, **kwargs):
+        with measure(request, 'view'):
+            return super().dispatch(request, *args, **kwargs)
+
+    def initial(self, request, *args, **kwargs):
+        with measure(request, 'auth'):
+            super().initial(request, *args, **kwargs)
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        timer = get_timer(self.request)
+        if timer is not None:
+            serializer.to_representation = timer.timed(
+                'serialize', serializer.to_representation
+            )
+        return serializer
@@ -1,34 +1,48 @@
+from datetime import timedelta
 from random import randrange
 
-from django.core.mail import send_mail
-from django.db import IntegrityError
-from django.db.models import Avg
+from django.conf import settings
+from django.db import IntegrityError, transaction
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, mixins, status, viewsets
 from rest_framework.decorators import action, api_view, permission_classes
-from rest_framework.permissions import (AllowAny, IsAuthenticated,
-                                        IsAuthenticatedOrReadOnly)
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
-from reviews.models import Category, Comment, Genre, Review, Title, User
+from reviews.models import (SCORE_FIELDS, Category, CategoryStats, Comment,
+                            Genre, GenreStats, OutboxEmail, Review, Title,
+                            User)
 
 from api_yamdb.settings import ADMIN_EMAIL
 
-from .filters import TitleFilter
+from .authentication import access_token_for_user, get_full_user
+from .cache import (CATEGORIES, GENRES, TITLES, CatalogueCacheMixin,
+                    TitleCacheMixin, bump_generations_on_commit,
+                    single_flight, title_generation)
+from .conditional import (EditedConditionalGetMixin,
+                          GenerationConditionalGetMixin)
+from .filters import StableOrderingFilter, TitleFilter
+from .pagination import COUNT_CACHED, COUNT_EXACT, PubDateCursorPagination
 from .permissions import (IsAdmin, IsAdminOrModeratorOrAuthorOrReadOnly,
                           ReadOnly)
-from .serializers import (AdminUserSerializer, CategorySerializer,
+from .readers import CommentReader, FastReadMixin, ReviewReader, TitleReader
+from .serializers import (AdminUserSerializer, BulkDeleteSerializer,
+                          CategorySerializer, CategoryStatsSerializer,
                           CommentSerializer, GenreSerializer,
-                          ReadOnlyTitleSerializer, ReviewSerializer,
-                          SignupSerializer, TitleSeraializer, TokenSerializer,
+                          GenreStatsSerializer, ReadOnlyTitleSerializer,
+                          ReviewSerializer, SignupSerializer,
+                          TitleBulkSerializer, TitleSeraializer,
+                          TokenSerializer, TopTitleSerializer,
                           UserSerializer)
+from .sparse import SparseFieldsetMixin
+from .timing import ServerTimingMixin
 
 NOT_AUTHENTICATED = 'У вас нет прав'
 SERIALIZER_INVALID = 'Неверно заполнен имейл и юзернейм'
 
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(ServerTimingMixin, viewsets.ModelViewSet):
     queryset = User.objects.all()
     serializer_class = AdminUserSerializer
     permission_classes = (IsAdmin,)
@@ -44,12 +58,11 @@ class UserViewSet(viewsets.ModelViewSet):
         permission_classes=(IsAuthenticated,)
     )
     def about_me(self, request):
-        serializer = UserSerializer(request.user)
+        user = get_full_user(request.user)
+        serializer = UserSerializer(user)
         if request.method != 'PATCH':
             return Response(serializer.data, status=status.HTTP_200_OK)
-        serializer = UserSerializer(
-            request.user, data=request.data, partial=True
-        )
+        serializer = UserSerializer(user, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
         serializer.save()
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -72,8 +85,12 @@ def signup(request):
         user.code = randrange(1111, 9999)
         user.save()
     message = f'{user.code} - код для авторизации'
-    email = [user.email]
-    send_mail(subject, message, ADMIN_EMAIL, email)
+    OutboxEmail.objects.create(
+        recipient=user.email,
+        from_email=ADMIN_EMAIL,
+        subject=subject,
+        body=message
+    )
     return Response(serializer.data, status=status.HTTP_200_OK)
 
 
@@ -85,13 +102,11 @@ def get_token(request):
     username = serializer.validated_data['username']
     user = get_object_or_404(User, username=username)
     confirmation_code = serializer.data['confirmation_code']
-    if not confirmation_code == user.code:
+    if user.code is None or confirmation_code != str(user.code):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-    token = RefreshToken.for_user(user)
-    return Response(
-        {'token': str(token.access_token)}, status=status.HTTP_200_OK
-    )
+    token = access_token_for_user(user)
+    return Response({'token': str(token)}, status=status.HTTP_200_OK)
 
 
 class SetPermissionsFiltersSearchFields(
@@ -106,59 +121,251 @@ class SetPermissionsFiltersSearchFields(
     lookup_field = 'slug'
 
 
-class CategoryViewSet(SetPermissionsFiltersSearchFields):
+class CatalogueStatsMixin:
+    stats_model = None
+    stats_serializer_class = None
+
+    def is_stale(self, item, refreshed_after):
+        return (
+            not hasattr(item, 'stats')
+            or item.stats.refreshed < refreshed_after
+        )
+
+    @action(detail=False, methods=['get'], url_path='stats', url_name='stats')
+    def stats(self, request):
+        queryset = self.filter_queryset(
+            self.get_queryset()
+        ).select_related('stats')
+        items = list(queryset)
+        refreshed_after = timezone.now() - timedelta(
+            seconds=settings.CATALOGUE_STATS_MAX_AGE
+        )
+        if any(self.is_stale(item, refreshed_after) for item in items):
+            with single_flight(
+                self.stats_model._meta.label_lower,
+                settings.CATALOGUE_STATS_REFRESH_TIMEOUT
+            ) as acquired:
+                if acquired:
+                    self.stats_model.objects.refresh()
+                    items = list(queryset.all())
+        serializer = self.stats_serializer_class(items, many=True)
+        return Response(serializer.data)
+
+
+class CategoryViewSet(ServerTimingMixin, CatalogueCacheMixin,
+                      CatalogueStatsMixin, SetPermissionsFiltersSearchFields):
+    cache_generations = (CATEGORIES,)
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
+    stats_model = CategoryStats
+    stats_serializer_class = CategoryStatsSerializer
 
 
-class GenreViewSet(SetPermissionsFiltersSearchFields):
+class GenreViewSet(ServerTimingMixin, CatalogueCacheMixin,
+                   CatalogueStatsMixin, SetPermissionsFiltersSearchFields):
+    cache_generations = (GENRES,)
     queryset = Genre.objects.all()
     serializer_class = GenreSerializer
+    stats_model = GenreStats
+    stats_serializer_class = GenreStatsSerializer
 
 
-class TitleViewSet(viewsets.ModelViewSet):
-    queryset = Title.objects.annotate(rating=Avg('reviews__score')).all()
+class TitleViewSet(ServerTimingMixin, GenerationConditionalGetMixin,
+                   TitleCacheMixin, SparseFieldsetMixin, FastReadMixin,
+                   viewsets.ModelViewSet):
+    queryset = Title.objects.select_related(
+        'category'
+    ).prefetch_related('genre')
+    sparse_columns = {
+        'id': (),
+        'name': ('name',),
+        'year': ('year',),
+        'rating': ('rating',),
+        'description': ('description',),
+        'genre': (),
+        'category': ('category__name', 'category__slug'),
+        'score_distribution': SCORE_FIELDS,
+    }
+    sparse_optional_fields = ('score_distribution',)
+    sparse_select_related = {'category': 'category'}
+    sparse_prefetch_related = {'genre': 'genre'}
+    reader_class = TitleReader
+    pagination_count_mode = COUNT_CACHED
     serializer_class = TitleSeraializer
     permission_classes = (IsAdmin | ReadOnly,)
-    filter_backends = (DjangoFilterBackend,)
+    filter_backends = (DjangoFilterBackend, StableOrderingFilter)
     filterset_class = TitleFilter
-    ordering_fields = ('name',)
+    ordering_fields = ('rating', 'year', 'name', 'reviews_count')
+    ordering = ('id',)
 
     def get_serializer_class(self):
         if self.action in ['create', 'update', 'partial_update']:
             return TitleSeraializer
+        if self.action == 'top':
+            return TopTitleSerializer
         return ReadOnlyTitleSerializer
 
+    @action(detail=False, methods=['get'], url_path='top', url_name='top')
+    def top(self, request):
+        queryset = Title.objects.filter(
+            ranking__weighted_rating__isnull=False
+        ).select_related('category', 'ranking').prefetch_related('genre')
+        queryset = DjangoFilterBackend().filter_queryset(
+            request, queryset, self
+        ).order_by('-ranking__weighted_rating', 'ranking__title')
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @action(
+        detail=True,
+        methods=['get'],
+        url_path='score-distribution',
+        url_name='score-distribution'
+    )
+    def score_distribution(self, request, pk=None):
+        title = get_object_or_404(
+            Title.objects.only('reviews_count', *SCORE_FIELDS), pk=pk
+        )
+        return Response({
+            'reviews_count': title.reviews_count,
+            'score_distribution': title.score_distribution,
+        })
+
+    @action(
+        detail=False,
+        methods=['post'],
+        url_path='bulk',
+        url_name='bulk',
+        permission_classes=(IsAdmin,)
+    )
+    def bulk(self, request):
+        serializer = TitleBulkSerializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        titles = serializer.save()
+        bump_generations_on_commit(TITLES, *(
+            title_generation(title.pk) for title in titles
+            if not title.bulk_created
+        ))
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class BulkDestroyMixin:
 
-class ReviewViewSet(viewsets.ModelViewSet):
+    def get_permitted_queryset(self):
+        queryset = self.get_queryset()
+        for permission in self.get_permissions():
+            if hasattr(permission, 'filter_queryset'):
+                queryset = permission.filter_queryset(self.request, queryset)
+        return queryset
+
+    @action(
+        detail=False,
+        methods=['post'],
+        url_path='bulk-delete',
+        url_name='bulk-delete'
+    )
+    def bulk_delete(self, request, *args, **kwargs):
+        serializer = BulkDeleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        queryset = self.get_permitted_queryset().filter(
+            pk__in=serializer.validated_data['ids']
+        )
+        with transaction.atomic():
+            deleted = list(
+                queryset.order_by('id').values_list('id', flat=True)
+            )
+            queryset.model.objects.filter(pk__in=deleted).delete()
+        return Response({'deleted': deleted}, status=status.HTTP_200_OK)
+
+
+class ReviewViewSet(ServerTimingMixin, EditedConditionalGetMixin,
+                    SparseFieldsetMixin, FastReadMixin, BulkDestroyMixin,
+                    viewsets.ModelViewSet):
+    pagination_class = PubDateCursorPagination
+    pagination_count_mode = COUNT_EXACT
+    reader_class = ReviewReader
+    conditional_model = Review
+    conditional_lookups = {'title_id': 'title_id'}
+    conditional_edited = ('edited', 'author__edited')
+    sparse_columns = {
+        'id': (),
+        'text': ('text',),
+        'author': ('author__username', 'author__role'),
+        'score': ('score',),
+        'pub_date': (),
+    }
+    sparse_required_columns = ('pub_date', 'title_id')
+    sparse_select_related = {'author': 'author'}
     serializer_class = ReviewSerializer
-    permission_classes = (
-        IsAuthenticatedOrReadOnly & IsAdminOrModeratorOrAuthorOrReadOnly,)
+    permission_classes = (IsAdminOrModeratorOrAuthorOrReadOnly,)
 
     def get_title(self):
-        return get_object_or_404(Title, pk=self.kwargs.get('title_id'))
+        if not hasattr(self, '_title'):
+            self._title = get_object_or_404(
+                Title.objects.only('id'), pk=self.kwargs.get('title_id')
+            )
+        return self._title
 
     def get_queryset(self):
-        return self.get_title().reviews.all()
+        queryset = Review.objects.filter(
+            title_id=self.kwargs.get('title_id')
+        ).select_related('author')
+        if not self.detail:
+            self.get_title()
+        return queryset
 
     def perform_create(self, serializer):
-        serializer.save(author=self.request.user,
-                        title=self.get_title())
+        try:
+            serializer.save(author=self.request.user,
+                            title_id=self.kwargs.get('title_id'))
+        except IntegrityError:
+            self.get_title()
+            raise
 
 
-class CommentViewSet(viewsets.ModelViewSet):
+class CommentViewSet(ServerTimingMixin, EditedConditionalGetMixin,
+                     SparseFieldsetMixin, FastReadMixin, BulkDestroyMixin,
+                     viewsets.ModelViewSet):
+    pagination_class = PubDateCursorPagination
+    pagination_count_mode = COUNT_EXACT
+    reader_class = CommentReader
+    conditional_model = Comment
+    conditional_lookups = {
+        'review_id': 'review_id',
+        'review__title_id': 'title_id',
+    }
+    conditional_edited = ('edited', 'author__edited')
+    sparse_columns = {
+        'id': (),
+        'text': ('text',),
+        'author': ('author__username', 'author__role'),
+        'pub_date': (),
+    }
+    sparse_required_columns = ('pub_date',)
+    sparse_select_related = {'author': 'author'}
     serializer_class = CommentSerializer
-    permission_classes = (
-        IsAuthenticatedOrReadOnly & IsAdminOrModeratorOrAuthorOrReadOnly,)
+    permission_classes = (IsAdminOrModeratorOrAuthorOrReadOnly,)
 
     def get_review(self):
-        return get_object_or_404(Review, id=self.kwargs.get('review_id'),
-                                 title_id=self.kwargs.get('title_id'))
+        if not hasattr(self, '_review'):
+            self._review = get_object_or_404(
+                Review.objects.only('id'),
+                id=self.kwargs.get('review_id'),
+                title_id=self.kwargs.get('title_id')
+            )
+        return self._review
 
     def get_queryset(self):
-        if self.get_review():
-            return Comment.objects.filter(review_id=self.kwargs
-                                          .get('review_id'))
+        queryset = Comment.objects.filter(
+            review_id=self.kwargs.get('review_id')
+        ).select_related('author')
+        if self.detail:
+            return queryset.filter(
+                review__title_id=self.kwargs.get('title_id')
+            )
+        self.get_review()
+        return queryset
 
     def perform_create(self, serializer):
         serializer.save(author=self.request.user,
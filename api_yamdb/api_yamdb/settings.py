@@ -25,8 +25,8 @@ INSTALLED_APPS = [
     'rest_framework',
     'django_filters',
     'djoser',
-    'reviews',
-    'api',
+    'reviews.apps.ReviewsConfig',
+    'api.apps.ApiConfig',
 ]
 
 MIDDLEWARE = [
@@ -37,6 +37,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'api.timing.ServerTimingMiddleware',
 ]
 
 ROOT_URLCONF = 'api_yamdb.urls'
@@ -71,6 +72,50 @@ DATABASES = {
 }
 
 
+# Cache
+
+CATALOGUE_CACHE_BACKENDS = {
+    'locmem': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'catalogue',
+    },
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(BASE_DIR, 'cache'),
+    },
+    'shared': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'catalogue_cache',
+    },
+}
+CATALOGUE_CACHE_ALIAS = 'catalogue'
+AUTH_CACHE_BACKENDS = {
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(BASE_DIR, 'auth_cache'),
+    },
+    'shared': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'auth_cache',
+    },
+}
+AUTH_CACHE_ALIAS = 'auth'
+CATALOGUE_CACHE_TIMEOUT = 300
+PAGINATION_COUNT_CACHE_TIMEOUT = 60
+CATALOGUE_STATS_MAX_AGE = int(os.getenv('CATALOGUE_STATS_MAX_AGE', '300'))
+CATALOGUE_STATS_REFRESH_TIMEOUT = 60
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    CATALOGUE_CACHE_ALIAS: CATALOGUE_CACHE_BACKENDS[
+        os.getenv('CATALOGUE_CACHE', 'locmem')
+    ],
+    AUTH_CACHE_ALIAS: AUTH_CACHE_BACKENDS[os.getenv('AUTH_CACHE', 'file')],
+}
+
+
 # Password validation
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -108,11 +153,24 @@ STATIC_URL = '/static/'
 
 STATICFILES_DIRS = (os.path.join(BASE_DIR, 'static/'),)
 
+TITLES_BULK_MAX_SIZE = 1000
+BULK_DELETE_MAX_SIZE = 100
+TOP_TITLES_MIN_REVIEWS = int(os.getenv('TOP_TITLES_MIN_REVIEWS', '10'))
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'api.authentication.ClaimsJWTAuthentication',
+    ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'api.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.LimitOffsetPagination',
+    'DEFAULT_PARSER_CLASSES': [
+        'api.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+    'DEFAULT_PAGINATION_CLASS': 'api.pagination.CountModeLimitOffsetPagination',
     'PAGE_SIZE': 10,
 }
 
@@ -122,7 +180,35 @@ SIMPLE_JWT = {
     'AUTH_HEADER_TYPES': ('Bearer',),
 }
 
+AUTH_USER_CACHE_TTL = 60
+AUTH_USER_CACHE_SIZE = 10000
+
+SERVER_TIMING_ENABLED = os.getenv('SERVER_TIMING', '') == '1'
+SERVER_TIMING_SAMPLE_RATE = float(
+    os.getenv('SERVER_TIMING_SAMPLE_RATE', '0.01')
+)
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'api.timing': {
+            'handlers': ['console'],
+            'level': 'INFO',
+        },
+    },
+}
+
 ADMIN_EMAIL = 'Admin@YaMDb.ru'
 EMAIL_BACKEND = 'django.core.mail.backends.filebased.EmailBackend'
 EMAIL_FILE_PATH = os.path.join(BASE_DIR, 'sent_emails')
+EMAIL_OUTBOX_BATCH_SIZE = 100
+EMAIL_OUTBOX_MAX_ATTEMPTS = 5
+EMAIL_OUTBOX_RETRY_DELAY = 30
+EMAIL_OUTBOX_LEASE = 300
 AUTH_USER_MODEL = 'reviews.User'
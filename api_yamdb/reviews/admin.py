@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Category, Comment, Review, Title, User
+from .models import Category, Comment, OutboxEmail, Review, Title, User
 
 
 @admin.register(User)
@@ -22,3 +22,4 @@ admin.site.register(Review)
 admin.site.register(Comment)
 admin.site.register(Title)
 admin.site.register(Category)
+admin.site.register(OutboxEmail)
@@ -0,0 +1,49 @@
+import time
+from itertools import islice
+
+from django.core.management.color import no_style
+from django.db import connection, transaction
+
+
+def insert_rows(model, fields, rows, batch_size):
+    # Rows hold database-ready values for the given fields in order; they
+    # go through executemany, so auto_now values and signals are skipped
+    # just as in bulk_create.
+    quote = connection.ops.quote_name
+    sql = 'INSERT INTO {} ({}) VALUES ({})'.format(
+        quote(model._meta.db_table),
+        ', '.join(quote(field.column) for field in fields),
+        ', '.join(['%s'] * len(fields))
+    )
+    count = 0
+    started = time.monotonic()
+    rows = iter(rows)
+    with transaction.atomic(), connection.cursor() as cursor:
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            cursor.executemany(sql, batch)
+            count += len(batch)
+    elapsed = time.monotonic() - started
+    return count, count / elapsed if elapsed else count
+
+
+def bulk_insert(model, objects, batch_size):
+    fields = model._meta.concrete_fields
+    rows = (
+        [
+            field.get_db_prep_save(getattr(obj, field.attname), connection)
+            for field in fields
+        ]
+        for obj in objects
+    )
+    return insert_rows(model, fields, rows, batch_size)
+
+
+def reset_sequences(models):
+    # SQLite keeps sqlite_sequence in step with explicit ids by itself.
+    statements = connection.ops.sequence_reset_sql(no_style(), models)
+    with connection.cursor() as cursor:
+        for sql in statements:
+            cursor.execute(sql)
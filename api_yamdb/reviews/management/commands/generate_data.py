@@ -0,0 +1,192 @@
+import random
+from datetime import datetime, timedelta
+
+from django.core.management import BaseCommand, CommandError, call_command
+from django.db import connection
+from django.db.models import Max
+from django.utils import timezone
+from reviews.management.bulk import bulk_insert, insert_rows, reset_sequences
+from reviews.models import (JUST_USER, MODERATOR, SCORE_FIELDS, Category,
+                            Comment, Genre, Review, Title, TitleRanking, User)
+
+START_DATE = datetime(2015, 1, 1, tzinfo=timezone.utc)
+DATE_RANGE = timedelta(days=365 * 8).total_seconds()
+SCORE_WEIGHTS = (1, 1, 2, 3, 5, 8, 12, 16, 14, 10)
+TITLE_FIELDS = (
+    'id', 'name', 'description', 'year', 'category_id', 'score_sum',
+    'reviews_count', *SCORE_FIELDS
+)
+GENRE_LINK_FIELDS = ('title_id', 'genre_id')
+REVIEW_FIELDS = (
+    'id', 'title_id', 'author_id', 'text', 'score', 'pub_date', 'edited',
+)
+COMMENT_FIELDS = (
+    'id', 'review_id', 'author_id', 'text', 'pub_date', 'edited',
+)
+WORDS = (
+    'время', 'война', 'мир', 'любовь', 'город', 'море', 'ночь', 'дорога',
+    'песня', 'история', 'звезда', 'сердце', 'тайна', 'зима', 'дом', 'путь',
+    'небо', 'огонь', 'память', 'голос', 'остров', 'ветер', 'сад', 'свет',
+)
+
+
+class Command(BaseCommand):
+    help = 'Generate a seeded synthetic dataset for load testing'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--categories', type=int, default=10)
+        parser.add_argument('--genres', type=int, default=30)
+        parser.add_argument('--titles', type=int, default=10000)
+        parser.add_argument('--reviews', type=int, default=100000)
+        parser.add_argument('--comments', type=int, default=100000)
+        parser.add_argument(
+            '--skew', type=float, default=1.1,
+            help='Zipf exponent of reviews per title and comments per review'
+        )
+        parser.add_argument('--batch-size', type=int, default=10000)
+
+    def first_id(self, model):
+        return (model.objects.aggregate(last=Max('id'))['last'] or 0) + 1
+
+    def text(self, words):
+        return ' '.join(self.random.choices(WORDS, k=words)).capitalize()
+
+    def date(self):
+        return connection.ops.adapt_datetimefield_value(
+            START_DATE + timedelta(seconds=self.random.random() * DATE_RANGE)
+        )
+
+    def zipf_counts(self, total, size, cap):
+        weights = [1 / rank ** self.skew for rank in range(1, size + 1)]
+        scale = total / sum(weights)
+        counts = [min(cap, round(weight * scale)) for weight in weights]
+        self.random.shuffle(counts)
+        return counts
+
+    def users(self, first, count):
+        joined = timezone.now()
+        for pk in range(first, first + count):
+            yield User(
+                id=pk, username=f'user{pk}', email=f'user{pk}@yamdb.fake',
+                role=MODERATOR if self.random.random() < 0.01 else JUST_USER,
+                password='', date_joined=joined, edited=joined
+            )
+
+    def groups(self, model, first, count, name):
+        for pk in range(first, first + count):
+            yield model(id=pk, name=f'{name} {pk}', slug=f'{name}-{pk}')
+
+    def titles(self, first, count, categories):
+        for pk in range(first, first + count):
+            yield (
+                pk, self.text(self.random.randint(1, 4)),
+                self.text(self.random.randint(10, 40)),
+                self.random.randint(1900, 2022),
+                self.random.choice(categories), 0, 0,
+                *(0 for _ in SCORE_FIELDS)
+            )
+
+    def genre_links(self, titles, genres):
+        for title_id in titles:
+            for genre_id in self.random.sample(
+                genres, min(len(genres), self.random.randint(1, 3))
+            ):
+                yield title_id, genre_id
+
+    def reviews(self, first, titles, users, total):
+        pk = first
+        counts = self.zipf_counts(total, len(titles), len(users))
+        scores = range(1, 11)
+        for title_id, count in zip(titles, counts):
+            authors = self.random.sample(range(len(users)), count)
+            for author_index, score in zip(authors, self.random.choices(
+                scores, SCORE_WEIGHTS, k=count
+            )):
+                pub_date = self.date()
+                yield (
+                    pk, title_id, users[author_index],
+                    self.text(self.random.randint(5, 60)), score,
+                    pub_date, pub_date
+                )
+                pk += 1
+
+    def comments(self, first, reviews, users, total):
+        for pk in range(first, first + total):
+            review_id = reviews[int(
+                len(reviews) * self.random.random() ** (1 + self.skew)
+            )]
+            pub_date = self.date()
+            yield (
+                pk, review_id, self.random.choice(users),
+                self.text(self.random.randint(3, 30)), pub_date, pub_date
+            )
+
+    def report(self, model, count, speed):
+        self.stdout.write(
+            f'{model._meta.db_table}: {count} rows, {speed:.0f} rows/s'
+        )
+        return count
+
+    def insert(self, model, objects):
+        return self.report(
+            model, *bulk_insert(model, objects, self.batch_size)
+        )
+
+    def insert_rows(self, model, field_names, rows):
+        fields = [model._meta.get_field(name) for name in field_names]
+        return self.report(
+            model, *insert_rows(model, fields, rows, self.batch_size)
+        )
+
+    def handle(self, *args, **options):
+        for option in ('users', 'categories', 'genres', 'titles'):
+            if options[option] < 1:
+                raise CommandError(f'--{option} must be positive')
+        self.random = random.Random(options['seed'])
+        self.skew = options['skew']
+        self.batch_size = options['batch_size']
+        first = {
+            model: self.first_id(model)
+            for model in (User, Category, Genre, Title, Review, Comment)
+        }
+        ids = {
+            model: list(range(first[model], first[model] + options[option]))
+            for model, option in (
+                (User, 'users'), (Category, 'categories'),
+                (Genre, 'genres'), (Title, 'titles'),
+            )
+        }
+        self.insert(User, self.users(first[User], options['users']))
+        self.insert(Category, self.groups(
+            Category, first[Category], options['categories'], 'category'
+        ))
+        self.insert(Genre, self.groups(
+            Genre, first[Genre], options['genres'], 'genre'
+        ))
+        self.insert_rows(Title, TITLE_FIELDS, self.titles(
+            first[Title], options['titles'], ids[Category]
+        ))
+        self.insert_rows(
+            Title.genre.through, GENRE_LINK_FIELDS,
+            self.genre_links(ids[Title], ids[Genre])
+        )
+        reviews_count = self.insert_rows(Review, REVIEW_FIELDS, self.reviews(
+            first[Review], ids[Title], ids[User], options['reviews']
+        ))
+        if reviews_count:
+            self.insert_rows(Comment, COMMENT_FIELDS, self.comments(
+                first[Comment],
+                range(first[Review], first[Review] + reviews_count),
+                ids[User], options['comments']
+            ))
+        reset_sequences(
+            [User, Category, Genre, Title, Title.genre.through, Review,
+             Comment]
+        )
+        Title.objects.all().recalculate_rating()
+        Title.objects.all().recalculate_score_distribution()
+        TitleRanking.objects.refresh()
+        call_command('catalogue_cache', clear=True, stdout=self.stdout)
+        self.stdout.write(self.style.SUCCESS('Successfully generated data'))
@@ -1,29 +1,77 @@
 import csv
+import os
 
 from django.conf import settings
-from django.core.management import BaseCommand
-from reviews.models import Category, Comment, Genre, Review, Title, User
+from django.core.management import BaseCommand, CommandError, call_command
+from django.utils import timezone
+from reviews.management.bulk import bulk_insert, reset_sequences
+from reviews.models import (Category, Comment, Genre, Review, Title,
+                            TitleRanking, User)
 
-TABLES_DICT = {
-    User: 'users.csv',
-    Category: 'category.csv',
-    Genre: 'genre.csv',
-    Title: 'titles.csv',
-    Review: 'review.csv',
-    Comment: 'comments.csv',
-}
+TABLES = (
+    (User, 'users.csv'),
+    (Category, 'category.csv'),
+    (Genre, 'genre.csv'),
+    (Title, 'titles.csv'),
+    (Title.genre.through, 'genre_title.csv'),
+    (Review, 'review.csv'),
+    (Comment, 'comments.csv'),
+)
+DEFAULT_BATCH_SIZE = 5000
 
 
 class Command(BaseCommand):
     help = 'Load data from csv files'
 
-    def handle(self, *args, **kwargs):
-        for model, base in TABLES_DICT.items():
-            with open(
-                f'{settings.BASE_DIR}/static/data/{base}',
-                'r', encoding='utf-8'
-            ) as csv_file:
-                reader = csv.DictReader(csv_file)
-                model.objects.bulk_create(model(**data) for data in reader)
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=DEFAULT_BATCH_SIZE
+        )
+        parser.add_argument(
+            '--path', default=os.path.join(settings.BASE_DIR, 'static/data')
+        )
 
+    def get_columns(self, model, header):
+        columns = []
+        for column in header:
+            field = model._meta.get_field(column)
+            columns.append((column, field.attname, field.null))
+        return columns
+
+    def read_rows(self, model, reader):
+        columns = self.get_columns(model, reader.fieldnames)
+        has_edited = any(
+            field.name == 'edited' for field in model._meta.concrete_fields
+        )
+        now = timezone.now()
+        for row in reader:
+            data = {}
+            for column, attname, null in columns:
+                value = row[column]
+                data[attname] = None if value == '' and null else value
+            if has_edited:
+                data['edited'] = data.get('pub_date', now)
+            yield model(**data)
+
+    def load(self, model, path, batch_size):
+        with open(path, 'r', encoding='utf-8') as csv_file:
+            rows = self.read_rows(model, csv.DictReader(csv_file))
+            return bulk_insert(model, rows, batch_size)
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('Batch size must be positive')
+        for model, filename in TABLES:
+            path = os.path.join(options['path'], filename)
+            if not os.path.exists(path):
+                raise CommandError(f'File {path} does not exist')
+            count, speed = self.load(model, path, options['batch_size'])
+            self.stdout.write(
+                f'{filename}: {count} rows, {speed:.0f} rows/s'
+            )
+        reset_sequences([model for model, _ in TABLES])
+        Title.objects.all().recalculate_rating()
+        Title.objects.all().recalculate_score_distribution()
+        TitleRanking.objects.refresh()
+        call_command('catalogue_cache', clear=True, stdout=self.stdout)
         self.stdout.write(self.style.SUCCESS('Successfully load data'))
@@ -0,0 +1,12 @@
+from django.core.management import BaseCommand
+from reviews.models import Title
+
+
+class Command(BaseCommand):
+    help = 'Rebuild stored score distribution of titles from reviews'
+
+    def handle(self, *args, **kwargs):
+        updated = Title.objects.all().recalculate_score_distribution()
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully rebuilt {updated} titles')
+        )
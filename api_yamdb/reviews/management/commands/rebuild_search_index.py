@@ -0,0 +1,13 @@
+from django.core.management import BaseCommand, CommandError
+from reviews.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuild full-text search index of titles'
+
+    def handle(self, *args, **kwargs):
+        if not rebuild_search_index():
+            raise CommandError(
+                'Full-text search index is supported only on SQLite'
+            )
+        self.stdout.write(self.style.SUCCESS('Successfully rebuilt index'))
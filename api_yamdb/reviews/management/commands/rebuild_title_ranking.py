@@ -0,0 +1,12 @@
+from django.core.management import BaseCommand
+from reviews.models import TitleRanking
+
+
+class Command(BaseCommand):
+    help = 'Recompute weighted ranking of titles from stored ratings'
+
+    def handle(self, *args, **kwargs):
+        ranked = TitleRanking.objects.refresh()
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully ranked {ranked} titles')
+        )
@@ -0,0 +1,12 @@
+from django.core.management import BaseCommand
+from reviews.models import Title
+
+
+class Command(BaseCommand):
+    help = 'Recalculate stored rating, score sum and reviews count of titles'
+
+    def handle(self, *args, **kwargs):
+        updated = Title.objects.all().recalculate_rating()
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully recalculated {updated} titles')
+        )
@@ -0,0 +1,14 @@
+from django.core.management import BaseCommand
+from reviews.models import CategoryStats, GenreStats
+
+
+class Command(BaseCommand):
+    help = 'Refresh genre and category statistics from titles'
+
+    def handle(self, *args, **kwargs):
+        genres = GenreStats.objects.refresh()
+        categories = CategoryStats.objects.refresh()
+        self.stdout.write(self.style.SUCCESS(
+            f'Successfully refreshed {genres} genres '
+            f'and {categories} categories'
+        ))
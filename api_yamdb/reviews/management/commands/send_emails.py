@@ -0,0 +1,167 @@
+import logging
+import random
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.core.management import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Min
+from django.utils import timezone
+from reviews.models import OutboxEmail
+
+logger = logging.getLogger(__name__)
+
+MAX_RETRY_DELAY = 3600
+
+
+class Command(BaseCommand):
+    help = 'Deliver queued emails in batches with retries'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int,
+            default=settings.EMAIL_OUTBOX_BATCH_SIZE
+        )
+        parser.add_argument(
+            '--max-attempts', type=int,
+            default=settings.EMAIL_OUTBOX_MAX_ATTEMPTS
+        )
+        parser.add_argument(
+            '--loop', action='store_true',
+            help='Keep polling the outbox instead of exiting when drained'
+        )
+        parser.add_argument('--interval', type=float, default=5)
+        parser.add_argument(
+            '--stats', action='store_true',
+            help='Print outbox metrics and exit'
+        )
+
+    def pending(self):
+        return OutboxEmail.objects.filter(
+            sent__isnull=True, next_attempt__isnull=False
+        )
+
+    def due_ids(self, now, batch_size):
+        due = self.pending().filter(
+            next_attempt__lte=now
+        ).order_by('next_attempt')
+        if connection.features.has_select_for_update_skip_locked:
+            due = due.select_for_update(skip_locked=True)
+        return list(due.values_list('id', flat=True)[:batch_size])
+
+    def claim_batch(self, batch_size):
+        # Without skip_locked (SQLite) two workers may read the same ids, so
+        # the lease is taken only on rows still due and each worker keeps
+        # the rows carrying its own lease; the sub-second jitter keeps the
+        # leases of concurrent workers apart.
+        now = timezone.now()
+        lease = now + timedelta(
+            seconds=settings.EMAIL_OUTBOX_LEASE,
+            microseconds=random.randrange(1000000)
+        )
+        with transaction.atomic():
+            ids = self.due_ids(now, batch_size)
+            self.pending().filter(
+                id__in=ids, next_attempt__lte=now
+            ).update(next_attempt=lease)
+        return list(OutboxEmail.objects.filter(id__in=ids, next_attempt=lease))
+
+    def deliver(self, emails, max_attempts):
+        latencies = []
+        failed = 0
+        email_connection = get_connection()
+        try:
+            email_connection.open()
+        except Exception as error:
+            for email in emails:
+                email.attempts += 1
+                self.schedule_retry(email, error, max_attempts)
+            return latencies, len(emails)
+        try:
+            for email in emails:
+                message = EmailMessage(
+                    email.subject, email.body, email.from_email,
+                    [email.recipient], connection=email_connection
+                )
+                email.attempts += 1
+                try:
+                    message.send()
+                except Exception as error:
+                    failed += 1
+                    self.schedule_retry(email, error, max_attempts)
+                    continue
+                sent = timezone.now()
+                latencies.append((sent - email.created).total_seconds())
+                OutboxEmail.objects.filter(pk=email.pk).update(
+                    sent=sent, attempts=email.attempts, last_error=''
+                )
+        finally:
+            email_connection.close()
+        return latencies, failed
+
+    def schedule_retry(self, email, error, max_attempts):
+        next_attempt = None
+        if email.attempts < max_attempts:
+            delay = min(
+                settings.EMAIL_OUTBOX_RETRY_DELAY * 2 ** (email.attempts - 1),
+                MAX_RETRY_DELAY
+            )
+            next_attempt = timezone.now() + timedelta(seconds=delay)
+        logger.warning(
+            'Email %s delivery failed (attempt %s): %s',
+            email.pk, email.attempts, error
+        )
+        OutboxEmail.objects.filter(pk=email.pk).update(
+            attempts=email.attempts, next_attempt=next_attempt,
+            last_error=str(error)
+        )
+
+    def format_latencies(self, latencies):
+        average = sum(latencies) / len(latencies) if latencies else 0
+        return (
+            f'avg latency: {average:.2f}s, '
+            f'max latency: {max(latencies, default=0):.2f}s'
+        )
+
+    def write_stats(self):
+        oldest = self.pending().aggregate(oldest=Min('created'))['oldest']
+        failed = OutboxEmail.objects.filter(
+            sent__isnull=True, next_attempt__isnull=True
+        ).count()
+        delivered = OutboxEmail.objects.filter(
+            sent__gte=timezone.now() - timedelta(hours=1)
+        ).values_list('sent', 'created')
+        latencies = [
+            (sent - created).total_seconds() for sent, created in delivered
+        ]
+        self.stdout.write(
+            f'queue depth: {self.pending().count()}, failed: {failed}, '
+            f'oldest pending: {oldest.isoformat() if oldest else "-"}, '
+            f'sent last hour: {len(latencies)}, '
+            f'{self.format_latencies(latencies)}'
+        )
+
+    def handle(self, *args, **options):
+        if options['stats']:
+            self.write_stats()
+            return
+        while True:
+            emails = self.claim_batch(options['batch_size'])
+            if not emails:
+                if not options['loop']:
+                    break
+                time.sleep(options['interval'])
+                continue
+            started = time.monotonic()
+            latencies, failed = self.deliver(emails, options['max_attempts'])
+            message = (
+                f'sent: {len(latencies)}, failed: {failed}, '
+                f'batch time: {time.monotonic() - started:.2f}s, '
+                f'queue depth: {self.pending().count()}, '
+                f'{self.format_latencies(latencies)}'
+            )
+            logger.info('Outbox batch delivered: %s', message)
+            self.stdout.write(message)
+        self.stdout.write(self.style.SUCCESS('Outbox drained'))
@@ -0,0 +1,22 @@
+from django.db import migrations
+
+from reviews.search import drop_search_index, rebuild_search_index
+
+
+def create_title_search(apps, schema_editor):
+    rebuild_search_index(schema_editor.connection)
+
+
+def drop_title_search(apps, schema_editor):
+    drop_search_index(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0002_title_rating'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_title_search, drop_title_search),
+    ]
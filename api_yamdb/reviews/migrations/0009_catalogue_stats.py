@@ -0,0 +1,44 @@
+# Generated by Django 2.2.16 on 2026-10-18 18:43
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0008_title_score_distribution'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CategoryStats',
+            fields=[
+                ('titles_count', models.PositiveIntegerField(default=0, verbose_name='Количество произведений')),
+                ('reviews_count', models.PositiveIntegerField(default=0, verbose_name='Количество отзывов')),
+                ('rating', models.FloatField(blank=True, null=True, verbose_name='Средний рейтинг')),
+                ('refreshed', models.DateTimeField(verbose_name='Дата обновления')),
+                ('category', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='reviews.Category', verbose_name='Категория')),
+            ],
+            options={
+                'verbose_name': 'Статистика категории',
+                'verbose_name_plural': 'Статистика категорий',
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='GenreStats',
+            fields=[
+                ('titles_count', models.PositiveIntegerField(default=0, verbose_name='Количество произведений')),
+                ('reviews_count', models.PositiveIntegerField(default=0, verbose_name='Количество отзывов')),
+                ('rating', models.FloatField(blank=True, null=True, verbose_name='Средний рейтинг')),
+                ('refreshed', models.DateTimeField(verbose_name='Дата обновления')),
+                ('genre', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='reviews.Genre', verbose_name='Жанр')),
+            ],
+            options={
+                'verbose_name': 'Статистика жанра',
+                'verbose_name_plural': 'Статистика жанров',
+                'abstract': False,
+            },
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 2.2.16 on 2026-10-18 18:46
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Sum
+import django.db.models.deletion
+import reviews.models
+
+
+def fill_title_ranking(apps, schema_editor):
+    Title = apps.get_model('reviews', 'Title')
+    TitleRanking = apps.get_model('reviews', 'TitleRanking')
+    RankingPrior = apps.get_model('reviews', 'RankingPrior')
+    min_reviews = settings.TOP_TITLES_MIN_REVIEWS
+    totals = Title.objects.aggregate(
+        score_sum=Sum('score_sum'), reviews_count=Sum('reviews_count')
+    )
+    mean = reviews.models.DEFAULT_RANKING_MEAN
+    if totals['reviews_count']:
+        mean = totals['score_sum'] / totals['reviews_count']
+    RankingPrior.objects.create(mean=mean)
+    TitleRanking.objects.bulk_create(
+        TitleRanking(
+            title_id=pk,
+            weighted_rating=(
+                (score_sum + mean * min_reviews)
+                / (reviews_count + min_reviews)
+            )
+        )
+        for pk, score_sum, reviews_count in Title.objects.filter(
+            reviews_count__gt=0
+        ).values_list('pk', 'score_sum', 'reviews_count').iterator()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0009_catalogue_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RankingPrior',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('mean', models.FloatField(verbose_name='Средняя оценка')),
+                ('refreshed', models.DateTimeField(auto_now=True, verbose_name='Дата обновления')),
+            ],
+            options={
+                'verbose_name': 'Средняя оценка рейтинга',
+                'verbose_name_plural': 'Средние оценки рейтинга',
+            },
+        ),
+        migrations.CreateModel(
+            name='TitleRanking',
+            fields=[
+                ('title', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='ranking', serialize=False, to='reviews.Title', verbose_name='Произведение')),
+                ('weighted_rating', models.FloatField(null=True, verbose_name='Взвешенный рейтинг')),
+            ],
+            options={
+                'verbose_name': 'Место в рейтинге',
+                'verbose_name_plural': 'Рейтинг произведений',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='titleranking',
+            index=models.Index(fields=['-weighted_rating', 'title'], name='title_ranking_idx'),
+        ),
+        migrations.RunPython(fill_title_ranking, migrations.RunPython.noop),
+    ]
@@ -2,10 +2,16 @@
 import datetime
 import re
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models import (Avg, Case, Count, ExpressionWrapper, F,
+                              FloatField, IntegerField, OuterRef, Subquery,
+                              Sum, Value, When)
+from django.db.models.functions import Cast, Coalesce, NullIf
+from django.utils import timezone
 
 ADMIN = 'admin'
 MODERATOR = 'moderator'
@@ -21,6 +27,16 @@ INVALID_CHARACTER_ERR = ('Username указан неверно!'
                          'Можно использовать только латинские буквы,'
                          'цифры и @/./+/-/_')
 REGEX = re.compile(r'^[\w.@+-]+\Z')
+SCORES = range(1, 11)
+DEFAULT_RANKING_MEAN = (SCORES[0] + SCORES[-1]) / 2
+
+
+def score_field_name(score):
+    return f'score_{score}'
+
+
+SCORE_FIELDS = tuple(score_field_name(score) for score in SCORES)
+TITLE_COUNTER_FIELDS = ('rating', 'score_sum', 'reviews_count', *SCORE_FIELDS)
 
 
 def username_validator(value):
@@ -75,6 +91,7 @@ class User(AbstractUser):
         null=True,
         blank=True
     )
+    edited = models.DateTimeField('Дата изменения', auto_now=True)
 
     class Meta:
         verbose_name = 'Пользователь'
@@ -135,6 +152,66 @@ class Genre(BaseClassCategoryandGenre):
         verbose_name_plural = 'Жанры'
 
 
+class TitleQuerySet(models.QuerySet):
+
+    def apply_review_delta(self, added=None, removed=None):
+        score_delta = (added or 0) - (removed or 0)
+        count_delta = (added is not None) - (removed is not None)
+        reviews_count = F('reviews_count') + count_delta
+        scores = {}
+        if added != removed:
+            for score, delta in ((added, 1), (removed, -1)):
+                if score is not None:
+                    name = score_field_name(score)
+                    scores[name] = F(name) + delta
+        return self.update(
+            score_sum=F('score_sum') + score_delta,
+            reviews_count=reviews_count,
+            rating=Case(
+                When(reviews_count=-count_delta, then=Value(None)),
+                default=(
+                    Cast(F('score_sum') + score_delta, FloatField())
+                    / Cast(reviews_count, FloatField())
+                ),
+                output_field=FloatField()
+            ),
+            **scores
+        )
+
+    def recalculate_rating(self):
+        reviews = Review.objects.filter(
+            title=OuterRef('pk')
+        ).order_by().values('title')
+        return self.update(
+            score_sum=Coalesce(Subquery(
+                reviews.annotate(total=Sum('score')).values('total'),
+                output_field=IntegerField()
+            ), 0),
+            reviews_count=Coalesce(Subquery(
+                reviews.annotate(total=Count('pk')).values('total'),
+                output_field=IntegerField()
+            ), 0),
+            rating=Subquery(
+                reviews.annotate(total=Avg('score')).values('total'),
+                output_field=FloatField()
+            )
+        )
+
+    def recalculate_score_distribution(self):
+        reviews = Review.objects.filter(
+            title=OuterRef('pk')
+        ).order_by().values('title')
+        return self.update(**{
+            score_field_name(score): Coalesce(Subquery(
+                reviews.filter(score=score).annotate(
+                    total=Count('pk')
+                ).values('total'),
+                output_field=IntegerField()
+            ), 0)
+            for score in SCORES
+        })
+
+
 class Title(models.Model):
     name = models.TextField(
         verbose_name='Название',
@@ -160,13 +237,68 @@ class Title(models.Model):
         related_name='title',
         null=True
     )
+    rating = models.FloatField(
+        verbose_name='Рейтинг',
+        null=True,
+        blank=True,
+        editable=False
+    )
+    score_sum = models.PositiveIntegerField(
+        verbose_name='Сумма оценок',
+        default=0,
+        editable=False
+    )
+    reviews_count = models.PositiveIntegerField(
+        verbose_name='Количество отзывов',
+        default=0,
+        editable=False
+    )
+
+    objects = TitleQuerySet.as_manager()
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        if (
+            not self._state.adding and self.pk is not None
+            and kwargs.get('update_fields') is None
+            and not kwargs.get('force_insert')
+        ):
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in TITLE_COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
+    @property
+    def score_distribution(self):
+        return {
+            str(score): getattr(self, score_field_name(score))
+            for score in SCORES
+        }
+
     class Meta:
         verbose_name = 'Произведение'
         verbose_name_plural = 'Произведения'
+        indexes = [
+            models.Index(fields=['year'], name='title_year_idx'),
+            models.Index(fields=['name'], name='title_name_idx'),
+            models.Index(fields=['rating', 'id'], name='title_rating_idx'),
+            models.Index(
+                fields=['reviews_count', 'id'],
+                name='title_reviews_count_idx'
+            ),
+        ]
+
+
+for score in SCORES:
+    Title.add_to_class(score_field_name(score), models.PositiveIntegerField(
+        verbose_name=f'Оценок {score}',
+        default=0,
+        editable=False
+    ))
 
 
 class BaseClassReviewandComment(models.Model):
@@ -175,6 +307,7 @@ class BaseClassReviewandComment(models.Model):
     text = models.TextField()
     pub_date = models.DateTimeField(
         'Дата добавления', auto_now_add=True, db_index=True)
+    edited = models.DateTimeField('Дата изменения', auto_now=True)
 
     class Meta:
         abstract = True
@@ -198,8 +331,18 @@ class Review(BaseClassReviewandComment):
                 name='unique_review'
             )
         ]
+        indexes = [
+            models.Index(
+                fields=['title', 'pub_date', 'id'],
+                name='review_title_pub_date_idx'
+            )
+        ]
         default_related_name = 'reviews'
 
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
 
 class Comment(BaseClassReviewandComment):
     review = models.ForeignKey(
@@ -207,4 +350,243 @@ class Comment(BaseClassReviewandComment):
         related_name='comments')
 
     class Meta(BaseClassReviewandComment.Meta):
+        indexes = [
+            models.Index(
+                fields=['review', 'pub_date', 'id'],
+                name='comment_review_pub_date_idx'
+            )
+        ]
         default_related_name = 'comments'
+
+
+class CatalogueStatsQuerySet(models.QuerySet):
+
+    def refresh(self):
+        source = self.model._meta.pk.related_model
+        rows = source.objects.order_by().annotate(
+            titles_count=Count('title'),
+            reviews_count=Coalesce(Sum('title__reviews_count'), 0),
+            rating=Avg('title__rating')
+        ).values_list('pk', 'titles_count', 'reviews_count', 'rating')
+        refreshed = timezone.now()
+        with transaction.atomic():
+            self.model.objects.all().delete()
+            stats = self.model.objects.bulk_create(
+                self.model(
+                    pk=pk,
+                    titles_count=titles_count,
+                    reviews_count=reviews_count,
+                    rating=rating,
+                    refreshed=refreshed
+                )
+                for pk, titles_count, reviews_count, rating in rows
+            )
+        return len(stats)
+
+
+class BaseClassCatalogueStats(models.Model):
+    titles_count = models.PositiveIntegerField(
+        verbose_name='Количество произведений',
+        default=0
+    )
+    reviews_count = models.PositiveIntegerField(
+        verbose_name='Количество отзывов',
+        default=0
+    )
+    rating = models.FloatField(
+        verbose_name='Средний рейтинг',
+        null=True,
+        blank=True
+    )
+    refreshed = models.DateTimeField(verbose_name='Дата обновления')
+
+    objects = CatalogueStatsQuerySet.as_manager()
+
+    class Meta:
+        abstract = True
+
+
+class GenreStats(BaseClassCatalogueStats):
+    genre = models.OneToOneField(
+        Genre,
+        verbose_name='Жанр',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stats'
+    )
+
+    class Meta(BaseClassCatalogueStats.Meta):
+        verbose_name = 'Статистика жанра'
+        verbose_name_plural = 'Статистика жанров'
+
+
+class CategoryStats(BaseClassCatalogueStats):
+    category = models.OneToOneField(
+        Category,
+        verbose_name='Категория',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stats'
+    )
+
+    class Meta(BaseClassCatalogueStats.Meta):
+        verbose_name = 'Статистика категории'
+        verbose_name_plural = 'Статистика категорий'
+
+
+class RankingPrior(models.Model):
+    mean = models.FloatField(verbose_name='Средняя оценка')
+    refreshed = models.DateTimeField(
+        verbose_name='Дата обновления',
+        auto_now=True
+    )
+
+    class Meta:
+        verbose_name = 'Средняя оценка рейтинга'
+        verbose_name_plural = 'Средние оценки рейтинга'
+
+
+class TitleRankingQuerySet(models.QuerySet):
+
+    def weighted_rating(self):
+        min_reviews = settings.TOP_TITLES_MIN_REVIEWS
+        titles = Title.objects.filter(pk=OuterRef('title_id'))
+        mean = Coalesce(
+            Subquery(
+                RankingPrior.objects.values('mean')[:1],
+                output_field=FloatField()
+            ),
+            Value(DEFAULT_RANKING_MEAN)
+        )
+        return ExpressionWrapper(
+            (
+                Cast(Subquery(titles.values('score_sum')), FloatField())
+                + mean * min_reviews
+            ) / (
+                NullIf(Subquery(titles.values('reviews_count')), Value(0))
+                + min_reviews
+            ),
+            output_field=FloatField()
+        )
+
+    def rank_titles(self, title_ids):
+        return self.filter(title_id__in=title_ids).update(
+            weighted_rating=self.weighted_rating()
+        )
+
+    def add_title(self, title_id):
+        if self.rank_titles([title_id]):
+            return
+        try:
+            with transaction.atomic():
+                self.create(title_id=title_id)
+        except IntegrityError:
+            pass
+        self.rank_titles([title_id])
+
+    def refresh(self):
+        min_reviews = settings.TOP_TITLES_MIN_REVIEWS
+        totals = Title.objects.aggregate(
+            score_sum=Sum('score_sum'), reviews_count=Sum('reviews_count')
+        )
+        mean = DEFAULT_RANKING_MEAN
+        if totals['reviews_count']:
+            mean = totals['score_sum'] / totals['reviews_count']
+        titles = Title.objects.filter(reviews_count__gt=0).values_list(
+            'pk', 'score_sum', 'reviews_count'
+        )
+        with transaction.atomic():
+            RankingPrior.objects.all().delete()
+            RankingPrior.objects.create(mean=mean)
+            self.model.objects.all().delete()
+            ranking = self.model.objects.bulk_create(
+                (
+                    self.model(
+                        title_id=pk,
+                        weighted_rating=(
+                            (score_sum + mean * min_reviews)
+                            / (reviews_count + min_reviews)
+                        )
+                    )
+                    for pk, score_sum, reviews_count in titles.iterator()
+                )
+            )
+        return len(ranking)
+
+
+class TitleRanking(models.Model):
+    title = models.OneToOneField(
+        Title,
+        verbose_name='Произведение',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='ranking'
+    )
+    weighted_rating = models.FloatField(
+        verbose_name='Взвешенный рейтинг',
+        null=True
+    )
+
+    objects = TitleRankingQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = 'Место в рейтинге'
+        verbose_name_plural = 'Рейтинг произведений'
+        indexes = [
+            models.Index(
+                fields=['-weighted_rating', 'title'],
+                name='title_ranking_idx'
+            )
+        ]
+
+
+class OutboxEmail(models.Model):
+    recipient = models.EmailField(
+        verbose_name='Получатель',
+        max_length=254
+    )
+    from_email = models.EmailField(
+        verbose_name='Отправитель',
+        max_length=254
+    )
+    subject = models.CharField(
+        verbose_name='Тема',
+        max_length=256
+    )
+    body = models.TextField(verbose_name='Текст')
+    created = models.DateTimeField(
+        verbose_name='Дата добавления',
+        auto_now_add=True
+    )
+    next_attempt = models.DateTimeField(
+        verbose_name='Следующая попытка',
+        default=timezone.now,
+        null=True,
+        blank=True
+    )
+    sent = models.DateTimeField(
+        verbose_name='Дата отправки',
+        null=True,
+        blank=True
+    )
+    attempts = models.PositiveSmallIntegerField(
+        verbose_name='Попытки',
+        default=0
+    )
+    last_error = models.TextField(
+        verbose_name='Последняя ошибка',
+        blank=True
+    )
+
+    class Meta:
+        verbose_name = 'Письмо в очереди'
+        verbose_name_plural = 'Очередь писем'
+        indexes = [
+            models.Index(
+                fields=['sent', 'next_attempt'],
+                name='outbox_pending_idx'
+            )
+        ]
+
+    def __str__(self):
+        return f'{self.recipient}: {self.subject}'
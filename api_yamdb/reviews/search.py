@@ -0,0 +1,89 @@
+import re
+
+from django.db import connection
+from django.db.models import Q
+
+SEARCH_TABLE = 'reviews_title_search'
+TITLE_TABLE = 'reviews_title'
+SEARCH_TOKEN = re.compile(r'\w+')
+
+CREATE_SEARCH_INDEX_SQL = (
+    f'CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5('
+    f"name, description, content='{TITLE_TABLE}', content_rowid='id', "
+    "tokenize='unicode61')",
+    f'CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_insert '
+    f'AFTER INSERT ON {TITLE_TABLE} BEGIN '
+    f'INSERT INTO {SEARCH_TABLE}(rowid, name, description) '
+    'VALUES (new.id, new.name, new.description); END',
+    f'CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_delete '
+    f'AFTER DELETE ON {TITLE_TABLE} BEGIN '
+    f'INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, name, description) '
+    "VALUES ('delete', old.id, old.name, old.description); END",
+    f'CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_update '
+    f'AFTER UPDATE OF name, description ON {TITLE_TABLE} BEGIN '
+    f'INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, name, description) '
+    "VALUES ('delete', old.id, old.name, old.description); "
+    f'INSERT INTO {SEARCH_TABLE}(rowid, name, description) '
+    'VALUES (new.id, new.name, new.description); END',
+)
+DROP_SEARCH_INDEX_SQL = (
+    f'DROP TRIGGER IF EXISTS {SEARCH_TABLE}_insert',
+    f'DROP TRIGGER IF EXISTS {SEARCH_TABLE}_delete',
+    f'DROP TRIGGER IF EXISTS {SEARCH_TABLE}_update',
+    f'DROP TABLE IF EXISTS {SEARCH_TABLE}',
+)
+REBUILD_SEARCH_INDEX_SQL = (
+    f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')"
+)
+
+
+def search_index_supported(using=connection):
+    return using.vendor == 'sqlite'
+
+
+def create_search_index(using=connection):
+    if not search_index_supported(using):
+        return
+    with using.cursor() as cursor:
+        for sql in CREATE_SEARCH_INDEX_SQL:
+            cursor.execute(sql)
+
+
+def drop_search_index(using=connection):
+    if not search_index_supported(using):
+        return
+    with using.cursor() as cursor:
+        for sql in DROP_SEARCH_INDEX_SQL:
+            cursor.execute(sql)
+
+
+def rebuild_search_index(using=connection):
+    if not search_index_supported(using):
+        return False
+    create_search_index(using)
+    with using.cursor() as cursor:
+        cursor.execute(REBUILD_SEARCH_INDEX_SQL)
+    return True
+
+
+def search_titles(queryset, query):
+    tokens = SEARCH_TOKEN.findall(query)
+    if not tokens:
+        return queryset.none()
+    if not search_index_supported(connection):
+        condition = Q()
+        for token in tokens:
+            condition &= (
+                Q(name__icontains=token) | Q(description__icontains=token)
+            )
+        return queryset.filter(condition)
+    match = ' '.join(f'"{token}"*' for token in tokens)
+    return queryset.extra(
+        select={'search_rank': f'bm25({SEARCH_TABLE})'},
+        tables=[SEARCH_TABLE],
+        where=[
+            f'{SEARCH_TABLE}.rowid = {TITLE_TABLE}.id',
+            f'{SEARCH_TABLE} MATCH %s',
+        ],
+        params=[match],
+    ).order_by('search_rank', 'pk')
@@ -0,0 +1,58 @@
+from django.db import connections
+from django.db.models.signals import (post_delete, post_migrate, post_save,
+                                      pre_save)
+from django.dispatch import receiver
+
+from .models import Review, Title, TitleRanking
+from .search import create_search_index
+
+
+@receiver(pre_save, sender=Review)
+def remember_review_score(sender, instance, raw, **kwargs):
+    instance._previous_score = None
+    if raw or instance.pk is None:
+        return
+    instance._previous_score = Review.objects.filter(
+        pk=instance.pk
+    ).values_list('title_id', 'score').first()
+
+
+@receiver(post_save, sender=Review)
+def add_review_score(sender, instance, created, raw, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, '_previous_score', None)
+    if created or previous is None:
+        Title.objects.filter(pk=instance.title_id).apply_review_delta(
+            added=instance.score
+        )
+        TitleRanking.objects.add_title(instance.title_id)
+        return
+    title_id, score = previous
+    if title_id == instance.title_id:
+        if score != instance.score:
+            Title.objects.filter(pk=title_id).apply_review_delta(
+                added=instance.score, removed=score
+            )
+            TitleRanking.objects.rank_titles([title_id])
+        return
+    Title.objects.filter(pk=title_id).apply_review_delta(removed=score)
+    Title.objects.filter(pk=instance.title_id).apply_review_delta(
+        added=instance.score
+    )
+    TitleRanking.objects.rank_titles([title_id])
+    TitleRanking.objects.add_title(instance.title_id)
+
+
+@receiver(post_delete, sender=Review)
+def remove_review_score(sender, instance, **kwargs):
+    Title.objects.filter(pk=instance.title_id).apply_review_delta(
+        removed=instance.score
+    )
+    TitleRanking.objects.rank_titles([instance.title_id])
+
+
+@receiver(post_migrate)
+def restore_title_search_index(sender, using, **kwargs):
+    if sender.label == 'reviews':
+        create_search_index(connections[using])
@@ -1,6 +1,13 @@
+from contextlib import contextmanager
+
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import Avg, Count, Sum
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
+from reviews.models import Review, Title, TitleRanking
 
 
 def create_users_api(admin_client):
@@ -113,3 +120,53 @@ def create_comments(admin_client, admin):
     result.append({'id': create_comment(client_moderator, titles[0]["id"], reviews[0]["id"], 'qwerty321'),
                    'author': moderator.username, 'text': 'qwerty321'})
     return result, reviews, titles, user, moderator
+
+
+@contextmanager
+def assert_max_queries(max_queries, url):
+    with CaptureQueriesContext(connection) as context:
+        yield context
+    queries = '\n'.join(query['sql'] for query in context.captured_queries)
+    assert len(context) <= max_queries, (
+        f'Проверьте, что запрос `{url}` выполняет не больше {max_queries} '
+        f'запросов к базе данных, выполнено {len(context)}:\n{queries}'
+    )
+
+
+def title_counters_mismatches():
+    titles = Title.objects.annotate(
+        expected_sum=Sum('reviews__score'),
+        expected_count=Count('reviews'),
+        expected_rating=Avg('reviews__score')
+    )
+    mismatches = []
+    for title in titles:
+        expected = (
+            title.expected_sum or 0, title.expected_count,
+            title.expected_rating and round(title.expected_rating, 6)
+        )
+        stored = (
+            title.score_sum, title.reviews_count,
+            title.rating and round(title.rating, 6)
+        )
+        if expected != stored:
+            mismatches.append((title.pk, stored, expected))
+    return mismatches
+
+
+def title_ranking_mismatches():
+    min_reviews = settings.TOP_TITLES_MIN_REVIEWS
+    totals = Review.objects.aggregate(score_sum=Sum('score'), reviews_count=Count('pk'))
+    mean = totals['score_sum'] / totals['reviews_count']
+    expected = {
+        title['title_id']: round((title['score_sum'] + mean * min_reviews)
+                                 / (title['reviews_count'] + min_reviews), 6)
+        for title in Review.objects.order_by().values('title_id').annotate(
+            score_sum=Sum('score'), reviews_count=Count('pk')
+        )
+    }
+    stored = {
+        ranking.title_id: ranking.weighted_rating and round(ranking.weighted_rating, 6)
+        for ranking in TitleRanking.objects.all()
+    }
+    return sorted(set(expected.items()) ^ set(stored.items()))
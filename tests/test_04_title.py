@@ -249,3 +249,51 @@ class Test04TitleAPI:
         user, moderator = create_users_api(admin_client)
         self.check_permissions(user, 'обычного пользователя', titles, categories, genres)
         self.check_permissions(moderator, 'модератора', titles, categories, genres)
+
+    @pytest.mark.django_db(transaction=True)
+    def test_05_titles_search(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        response = client.get('/api/v1/titles/?search=драма')
+        data = response.json()
+        assert [title['id'] for title in data['results']] == [titles[1]['id']], (
+            'Проверьте, что при GET запросе `/api/v1/titles/?search=` поиск идёт по названию и описанию'
+        )
+        admin_client.patch(f'/api/v1/titles/{titles[0]["id"]}/', data={'name': 'Драматургия'})
+        response = client.get('/api/v1/titles/?search=драм')
+        data = response.json()
+        assert {title['id'] for title in data['results']} == {titles[0]['id'], titles[1]['id']}, (
+            'Проверьте, что при GET запросе `/api/v1/titles/?search=` индекс обновляется после изменения '
+            'произведения'
+        )
+        admin_client.delete(f'/api/v1/titles/{titles[1]["id"]}/')
+        response = client.get('/api/v1/titles/?search=драм')
+        data = response.json()
+        assert data['count'] == 1, (
+            'Проверьте, что при GET запросе `/api/v1/titles/?search=` удалённые произведения не находятся'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_06_titles_ordering(self, client, admin_client):
+        titles, categories, genres = create_titles(admin_client)
+        data = {'name': 'Ещё поворот', 'year': 2000, 'genre': [genres[0]['slug']],
+                'category': categories[0]['slug'], 'description': 'Повтор'}
+        titles.append({'id': admin_client.post('/api/v1/titles/', data=data).json()['id']})
+        admin_client.post(f'/api/v1/titles/{titles[1]["id"]}/reviews/', data={'text': 'Отлично', 'score': 9})
+        admin_client.post(f'/api/v1/titles/{titles[2]["id"]}/reviews/', data={'text': 'Хорошо', 'score': 7})
+        cases = (
+            ('year', [titles[0]['id'], titles[2]['id'], titles[1]['id']]),
+            ('-year', [titles[1]['id'], titles[2]['id'], titles[0]['id']]),
+            ('name', [titles[2]['id'], titles[0]['id'], titles[1]['id']]),
+            ('-rating', [titles[1]['id'], titles[2]['id'], titles[0]['id']]),
+            ('-reviews_count', [titles[2]['id'], titles[1]['id'], titles[0]['id']]),
+        )
+        for ordering, expected in cases:
+            response = client.get(f'/api/v1/titles/?ordering={ordering}')
+            assert [title['id'] for title in response.json()['results']] == expected, (
+                f'Проверьте, что при GET запросе `/api/v1/titles/?ordering={ordering}` произведения '
+                'отсортированы по полю, а при равенстве - по id в том же направлении'
+            )
+        response = client.get(f'/api/v1/titles/?genre={genres[0]["slug"]}&ordering=-year')
+        assert [title['id'] for title in response.json()['results']] == [titles[2]['id'], titles[0]['id']], (
+            'Проверьте, что сортировка произведений работает вместе с фильтрами'
+        )
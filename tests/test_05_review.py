@@ -334,3 +334,41 @@ class Test05ReviewAPI:
             'без токена авторизации возвращается статус 401'
         )
         self.check_permissions(user, 'обычного пользователя', reviews, titles)
+
+    @pytest.mark.django_db(transaction=True)
+    def test_05_reviews_cursor_pagination(self, client, admin_client, django_user_model):
+        from reviews.models import Review
+        titles, _, _ = create_titles(admin_client)
+        for i in range(7):
+            author = django_user_model.objects.create(username=f'reader{i}', email=f'reader{i}@yamdb.fake')
+            Review.objects.create(title_id=titles[0]['id'], author=author, text=f'text{i}', score=5)
+        expected = list(Review.objects.filter(title_id=titles[0]['id']).order_by('-pub_date', '-id')
+                        .values_list('id', flat=True))
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/?cursor=&limit=3'
+        response = client.get(url)
+        assert response.status_code == 200, (
+            'Проверьте, что при GET запросе `/api/v1/titles/{title_id}/reviews/?cursor=` возвращается статус 200'
+        )
+        data = response.json()
+        assert 'count' not in data and data['previous'] is None, (
+            'Проверьте, что при GET запросе `/api/v1/titles/{title_id}/reviews/?cursor=` '
+            'первая страница не содержит `count` и `previous`'
+        )
+        received = [review['id'] for review in data['results']]
+        author = django_user_model.objects.create(username='latecomer', email='latecomer@yamdb.fake')
+        Review.objects.create(title_id=titles[0]['id'], author=author, text='late', score=1)
+        while data['next']:
+            data = client.get(data['next']).json()
+            received += [review['id'] for review in data['results']]
+        assert received == expected, (
+            'Проверьте, что при GET запросе `/api/v1/titles/{title_id}/reviews/?cursor=` '
+            'курсор проходит все отзывы по убыванию `pub_date` без пропусков и повторов'
+        )
+        previous = client.get(data['previous']).json()
+        assert [review['id'] for review in previous['results']] == expected[3:6], (
+            'Проверьте, что ссылка `previous` курсорной пагинации возвращает предыдущую страницу'
+        )
+        response = client.get(f'/api/v1/titles/{titles[0]["id"]}/reviews/?cursor=broken')
+        assert response.status_code == 404, (
+            'Проверьте, что при GET запросе с неверным `cursor` возвращается статус 404'
+        )
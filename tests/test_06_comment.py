@@ -246,3 +246,37 @@ class Test06CommentAPI:
             'без токена авторизации возвращается статус 401'
         )
         self.check_permissions(user, 'обычного пользователя', f'{pre_url}{comments[2]["id"]}/')
+
+    @pytest.mark.django_db(transaction=True)
+    def test_05_comments_cursor_pagination(self, client, admin_client, admin, django_user_model):
+        from reviews.models import Comment
+        _, reviews, titles, _, _ = create_comments(admin_client, admin)
+        for i in range(4):
+            author = django_user_model.objects.create(username=f'reader{i}', email=f'reader{i}@yamdb.fake')
+            Comment.objects.create(review_id=reviews[0]['id'], author=author, text=f'text{i}')
+        expected = list(Comment.objects.filter(review_id=reviews[0]['id']).order_by('-pub_date', '-id')
+                        .values_list('id', flat=True))
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/{reviews[0]["id"]}/comments/?cursor=&limit=3'
+        response = client.get(url)
+        assert response.status_code == 200, (
+            'Проверьте, что при GET запросе `/api/v1/titles/{title_id}/reviews/{review_id}/comments/?cursor=` '
+            'возвращается статус 200'
+        )
+        data = response.json()
+        assert 'count' not in data and data['previous'] is None, (
+            'Проверьте, что при GET запросе `/api/v1/titles/{title_id}/reviews/{review_id}/comments/?cursor=` '
+            'первая страница не содержит `count` и `previous`'
+        )
+        received = [comment['id'] for comment in data['results']]
+        Comment.objects.create(review_id=reviews[0]['id'], author=admin, text='late')
+        while data['next']:
+            data = client.get(data['next']).json()
+            received += [comment['id'] for comment in data['results']]
+        assert received == expected, (
+            'Проверьте, что при GET запросе `/api/v1/titles/{title_id}/reviews/{review_id}/comments/?cursor=` '
+            'курсор проходит все комментарии по убыванию `pub_date` без пропусков и повторов'
+        )
+        previous = client.get(data['previous']).json()
+        assert [comment['id'] for comment in previous['results']] == expected[3:6], (
+            'Проверьте, что ссылка `previous` курсорной пагинации возвращает предыдущую страницу'
+        )
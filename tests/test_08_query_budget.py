@@ -0,0 +1,97 @@
+import pytest
+from reviews.models import Category, Genre, Review, Title
+
+from .common import assert_max_queries
+
+TITLES_COUNT = 120
+
+QUERY_BUDGET = {
+    '/api/v1/titles/': 3,
+    '/api/v1/titles/?limit=100': 3,
+    '/api/v1/titles/?genre=genre-1&category=category-1': 4,
+    '/api/v1/titles/{title_id}/': 2,
+    '/api/v1/categories/': 2,
+    '/api/v1/genres/': 2,
+}
+ADMIN_QUERY_BUDGET = {
+    '/api/v1/users/': 3,
+    '/api/v1/users/?limit=100': 3,
+    '/api/v1/users/me/': 1,
+}
+REVIEW_CREATE_BUDGET = 4
+COMMENT_CREATE_BUDGET = 2
+
+
+def create_catalogue():
+    categories = [
+        Category.objects.create(name=f'Категория {i}', slug=f'category-{i}')
+        for i in range(3)
+    ]
+    genres = [
+        Genre.objects.create(name=f'Жанр {i}', slug=f'genre-{i}')
+        for i in range(3)
+    ]
+    titles = [
+        Title.objects.create(
+            name=f'Произведение {i}', year=2000,
+            category=categories[i % len(categories)]
+        )
+        for i in range(TITLES_COUNT)
+    ]
+    for title in titles:
+        title.genre.set(genres[:title.pk % len(genres) + 1])
+    return titles
+
+
+class Test08QueryBudget:
+
+    @pytest.mark.django_db(transaction=True)
+    @pytest.mark.parametrize('url,max_queries', QUERY_BUDGET.items())
+    def test_01_query_budget_not_auth(self, client, url, max_queries):
+        titles = create_catalogue()
+        url = url.format(title_id=titles[0].pk)
+        with assert_max_queries(max_queries, url):
+            response = client.get(url)
+        assert response.status_code == 200, (
+            f'Проверьте, что при GET запросе `{url}` возвращается статус 200'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    @pytest.mark.parametrize('url,max_queries', ADMIN_QUERY_BUDGET.items())
+    def test_02_query_budget_admin(self, admin_client, django_user_model,
+                                   url, max_queries):
+        django_user_model.objects.bulk_create(
+            django_user_model(username=f'user{i}', email=f'user{i}@yamdb.fake')
+            for i in range(TITLES_COUNT)
+        )
+        with assert_max_queries(max_queries, url):
+            response = admin_client.get(url)
+        assert response.status_code == 200, (
+            f'Проверьте, что при GET запросе `{url}` возвращается статус 200'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_03_query_budget_create(self, admin, user_client, user):
+        title = create_catalogue()[0]
+        review = Review.objects.create(author=admin, title=title, text='Отзыв', score=5)
+        url = f'/api/v1/titles/{title.pk}/reviews/'
+        user_client.get(url)
+        with assert_max_queries(REVIEW_CREATE_BUDGET, url):
+            response = user_client.post(url, data={'text': 'Отзыв', 'score': 7})
+        assert response.status_code == 201 and response.json()['author'] == user.username, (
+            f'Проверьте, что при POST запросе `{url}` возвращается статус 201'
+        )
+        with assert_max_queries(REVIEW_CREATE_BUDGET, url):
+            response = user_client.post(url, data={'text': 'Отзыв', 'score': 8})
+        assert response.status_code == 400 and response.json() == {
+            'non_field_errors': ['Нельзя писать второй ревью']
+        }, (
+            f'Проверьте, что повторный POST запрос `{url}` возвращает ошибку о втором отзыве'
+        )
+        url = f'/api/v1/titles/{title.pk}/reviews/{review.pk}/comments/'
+        with assert_max_queries(COMMENT_CREATE_BUDGET, url):
+            response = user_client.post(url, data={'text': 'Комментарий'})
+        assert response.status_code == 201 and response.json()['author'] == user.username, (
+            f'Проверьте, что при POST запросе `{url}` возвращается статус 201'
+        )
+        assert Title.objects.get(pk=title.pk).reviews_count == 2
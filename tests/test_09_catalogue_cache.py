@@ -0,0 +1,52 @@
+import pytest
+
+from .common import create_reviews, create_titles
+
+
+class Test09CatalogueCache:
+
+    @pytest.mark.django_db(transaction=True)
+    def test_01_cache_hit(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        for url in ('/api/v1/titles/', f'/api/v1/titles/{titles[0]["id"]}/',
+                    '/api/v1/categories/', '/api/v1/genres/'):
+            first = client.get(url)
+            second = client.get(url)
+            assert first['X-Cache'] == 'MISS' and second['X-Cache'] == 'HIT', (
+                f'Проверьте, что повторный GET запрос `{url}` отдаётся из кеша'
+            )
+            assert first.json() == second.json(), (
+                f'Проверьте, что GET запрос `{url}` из кеша возвращает те же данные'
+            )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_02_cache_invalidation(self, client, admin_client, admin):
+        reviews, titles, user, _ = create_reviews(admin_client, admin)
+        title_url = f'/api/v1/titles/{titles[0]["id"]}/'
+        other_title_url = f'/api/v1/titles/{titles[1]["id"]}/'
+        for url in (title_url, other_title_url, '/api/v1/titles/', '/api/v1/categories/'):
+            client.get(url)
+        admin_client.delete(f'{title_url}reviews/{reviews[1]["id"]}/')
+        response = client.get(title_url)
+        assert response['X-Cache'] == 'MISS' and response.json()['rating'] == 4, (
+            'Проверьте, что новый или удалённый отзыв сбрасывает кеш своего произведения'
+        )
+        assert client.get('/api/v1/titles/')['X-Cache'] == 'MISS', (
+            'Проверьте, что изменение отзыва сбрасывает кеш списка произведений'
+        )
+        assert client.get(other_title_url)['X-Cache'] == 'HIT', (
+            'Проверьте, что изменение отзыва не сбрасывает кеш других произведений'
+        )
+        assert client.get('/api/v1/categories/')['X-Cache'] == 'HIT', (
+            'Проверьте, что изменение отзыва не сбрасывает кеш категорий'
+        )
+        admin_client.patch(title_url, data={'genre': ['drama']})
+        response = client.get(title_url)
+        assert [genre['slug'] for genre in response.json()['genre']] == ['drama'], (
+            'Проверьте, что изменение жанров произведения сбрасывает кеш произведения'
+        )
+        admin_client.delete('/api/v1/genres/drama/')
+        response = client.get(title_url)
+        assert response.json()['genre'] == [], (
+            'Проверьте, что удаление жанра сбрасывает кеш произведений'
+        )
@@ -0,0 +1,73 @@
+import pytest
+
+from .common import assert_max_queries, create_comments
+
+
+class Test10ConditionalGet:
+
+    def check_not_modified(self, client, url, max_queries):
+        response = client.get(url)
+        etag = response.get('ETag')
+        assert response.status_code == 200 and etag, (
+            f'Проверьте, что при GET запросе `{url}` возвращается заголовок `ETag`'
+        )
+        with assert_max_queries(max_queries, url):
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304, (
+            f'Проверьте, что при GET запросе `{url}` с актуальным `If-None-Match` возвращается статус 304'
+        )
+        return etag
+
+    @pytest.mark.django_db(transaction=True)
+    def test_01_not_modified(self, client, admin_client, admin):
+        comments, reviews, titles, _, _ = create_comments(admin_client, admin)
+        title_url = f'/api/v1/titles/{titles[0]["id"]}/'
+        reviews_url = f'{title_url}reviews/'
+        comments_url = f'{reviews_url}{reviews[0]["id"]}/comments/'
+        self.check_not_modified(client, title_url, 0)
+        self.check_not_modified(client, '/api/v1/titles/', 0)
+        self.check_not_modified(client, reviews_url, 1)
+        self.check_not_modified(client, f'{reviews_url}{reviews[0]["id"]}/', 1)
+        self.check_not_modified(client, comments_url, 1)
+        response = client.get(reviews_url)
+        assert response.get('Last-Modified'), (
+            'Проверьте, что при GET запросе `/api/v1/titles/{title_id}/reviews/` '
+            'возвращается заголовок `Last-Modified`'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_02_modified(self, client, admin_client, admin):
+        comments, reviews, titles, _, _ = create_comments(admin_client, admin)
+        title_url = f'/api/v1/titles/{titles[0]["id"]}/'
+        reviews_url = f'{title_url}reviews/'
+        comments_url = f'{reviews_url}{reviews[0]["id"]}/comments/'
+        title_etag = self.check_not_modified(client, title_url, 0)
+        reviews_etag = self.check_not_modified(client, reviews_url, 1)
+        comments_etag = self.check_not_modified(client, comments_url, 1)
+        admin_client.patch(f'{reviews_url}{reviews[0]["id"]}/', data={'text': 'new', 'score': 10})
+        admin_client.patch(f'{comments_url}{comments[0]["id"]}/', data={'text': 'new'})
+        for url, etag in ((title_url, title_etag), (reviews_url, reviews_etag),
+                          (comments_url, comments_etag)):
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+            assert response.status_code == 200, (
+                f'Проверьте, что при GET запросе `{url}` после изменения данных '
+                'с устаревшим `If-None-Match` возвращается статус 200'
+            )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_03_author_modified(self, client, admin_client, admin):
+        comments, reviews, titles, user, _ = create_comments(admin_client, admin)
+        reviews_url = f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+        comments_url = f'{reviews_url}{reviews[0]["id"]}/comments/'
+        urls = (
+            reviews_url, f'{reviews_url}?expand=author', comments_url,
+            f'{reviews_url}{reviews[1]["id"]}/'
+        )
+        etags = [self.check_not_modified(client, url, 1) for url in urls]
+        admin_client.patch(f'/api/v1/users/{user.username}/', data={'role': 'moderator'})
+        for url, etag in zip(urls, etags):
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+            assert response.status_code == 200, (
+                f'Проверьте, что при GET запросе `{url}` после изменения автора '
+                'с устаревшим `If-None-Match` возвращается статус 200'
+            )
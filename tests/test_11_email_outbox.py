@@ -0,0 +1,62 @@
+import pytest
+from django.core import mail
+from django.core.management import call_command
+from django.utils import timezone
+from reviews.management.commands.send_emails import Command
+from reviews.models import OutboxEmail
+
+
+class Test11EmailOutbox:
+    url_signup = '/api/v1/auth/signup/'
+
+    @pytest.mark.django_db(transaction=True)
+    def test_01_signup_enqueues_email(self, client):
+        outbox_before_count = len(mail.outbox)
+        for i in range(3):
+            data = {'email': f'user{i}@yamdb.fake', 'username': f'user{i}'}
+            response = client.post(self.url_signup, data=data)
+            assert response.status_code == 200, (
+                f'Проверьте, что при POST запросе `{self.url_signup}` с валидными данными возвращается статус 200'
+            )
+        assert len(mail.outbox) == outbox_before_count, (
+            f'Проверьте, что POST запрос `{self.url_signup}` не отправляет письмо синхронно'
+        )
+        assert OutboxEmail.objects.filter(sent__isnull=True).count() == 3, (
+            f'Проверьте, что POST запрос `{self.url_signup}` ставит письмо в очередь'
+        )
+        call_command('send_emails', batch_size=2)
+        assert len(mail.outbox) == outbox_before_count + 3, (
+            'Проверьте, что команда `send_emails` отправляет все письма из очереди'
+        )
+        assert not OutboxEmail.objects.filter(sent__isnull=True).exists(), (
+            'Проверьте, что команда `send_emails` отмечает отправленные письма'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_02_failed_email_is_retried(self, client, settings):
+        client.post(self.url_signup, data={'email': 'user@yamdb.fake', 'username': 'user'})
+        settings.EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+        settings.EMAIL_PORT = 1
+        call_command('send_emails', max_attempts=2)
+        email = OutboxEmail.objects.get()
+        assert email.sent is None and email.attempts == 1 and email.next_attempt is not None, (
+            'Проверьте, что при ошибке отправки письмо остаётся в очереди для повторной попытки'
+        )
+        OutboxEmail.objects.update(next_attempt=email.created)
+        call_command('send_emails', max_attempts=2)
+        email.refresh_from_db()
+        assert email.attempts == 2 and email.next_attempt is None and email.last_error, (
+            'Проверьте, что после исчерпания попыток письмо больше не отправляется'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_03_concurrent_claim(self, client, monkeypatch):
+        for i in range(3):
+            client.post(self.url_signup, data={'email': f'user{i}@yamdb.fake', 'username': f'user{i}'})
+        first, second = Command(), Command()
+        ids = first.due_ids(timezone.now(), 10)
+        claimed = first.claim_batch(10)
+        monkeypatch.setattr(second, 'due_ids', lambda now, batch_size: ids)
+        assert len(claimed) == 3 and second.claim_batch(10) == [], (
+            'Проверьте, что команда `send_emails` не забирает письма, уже взятые другим обработчиком'
+        )
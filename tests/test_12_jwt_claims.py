@@ -0,0 +1,104 @@
+import time
+
+import pytest
+from api.authentication import (access_token_for_user, user_cache,
+                                user_changed_key)
+from api.checks import check_auth_cache
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .common import create_titles
+
+
+class Test12JWTClaims:
+    url_token = '/api/v1/auth/token/'
+
+    def get_client(self, django_user_model, username):
+        user = django_user_model.objects.create_user(
+            username=username, email=f'{username}@yamdb.fake', code=1234
+        )
+        response = APIClient().post(self.url_token, data={'username': username, 'confirmation_code': 1234})
+        token = response.json()['token']
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        return user, token, client
+
+    @pytest.mark.django_db(transaction=True)
+    def test_01_token_claims(self, django_user_model):
+        user, token, _ = self.get_client(django_user_model, 'reader')
+        token = AccessToken(token)
+        for claim, value in (('username', 'reader'), ('role', 'user'), ('is_staff', False)):
+            assert token.get(claim) == value, (
+                f'Проверьте, что токен, полученный по `{self.url_token}`, содержит `{claim}`'
+            )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_02_no_user_query(self, admin_client, django_user_model):
+        titles, _, _ = create_titles(admin_client)
+        _, _, client = self.get_client(django_user_model, 'reader')
+        with CaptureQueriesContext(connection) as context:
+            response = client.post(f'/api/v1/titles/{titles[0]["id"]}/reviews/', data={'text': 'ok', 'score': 7})
+        assert response.status_code == 201 and response.json()['author'] == 'reader', (
+            'Проверьте, что отзыв создаётся пользователем из токена'
+        )
+        assert not any('FROM "reviews_user"' in query['sql'] for query in context.captured_queries), (
+            'Проверьте, что аутентификация по токену с ролью не загружает пользователя из базы данных'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_03_role_change(self, admin_client, django_user_model):
+        _, _, client = self.get_client(django_user_model, 'reader')
+        data = {'name': 'Фильм', 'slug': 'films'}
+        assert client.post('/api/v1/categories/', data=data).status_code == 403, (
+            'Проверьте, что роль пользователя берётся из токена'
+        )
+        admin_client.patch('/api/v1/users/reader/', data={'role': 'admin'})
+        assert client.post('/api/v1/categories/', data=data).status_code == 201, (
+            'Проверьте, что после изменения роли старые данные токена не используются'
+        )
+        admin_client.delete('/api/v1/users/reader/')
+        assert client.get('/api/v1/users/me/').status_code == 401, (
+            'Проверьте, что токен удалённого пользователя не принимается'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_04_inactive_user(self, django_user_model):
+        user, _, client = self.get_client(django_user_model, 'reader')
+        user.is_active = False
+        token = access_token_for_user(user)
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        assert client.get('/api/v1/users/me/').status_code == 401, (
+            'Проверьте, что токен с `is_active=False` не принимается'
+        )
+        _, _, client = self.get_client(django_user_model, 'writer')
+        writer = django_user_model.objects.get(username='writer')
+        writer.is_active = False
+        writer.save()
+        assert client.get('/api/v1/users/me/').status_code == 401, (
+            'Проверьте, что после деактивации пользователя его токен не принимается'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_05_shared_invalidation(self, admin_client, django_user_model):
+        user, _, client = self.get_client(django_user_model, 'reader')
+        assert client.get('/api/v1/users/me/').json()['role'] == 'user'
+        admin_client.patch('/api/v1/users/reader/', data={'role': 'admin'})
+        assert caches[settings.AUTH_CACHE_ALIAS].get(user_changed_key(user.pk)) is not None, (
+            'Проверьте, что отметка об изменении пользователя хранится в общем кэше `AUTH_CACHE_ALIAS`'
+        )
+        user_cache.set(user.pk, user)
+        assert user_cache.get(user.pk, changed=time.time() + 1) is None, (
+            'Проверьте, что пользователь, загруженный до изменения, не берётся из кэша процесса'
+        )
+        with override_settings(CACHES={
+            **settings.CACHES,
+            settings.AUTH_CACHE_ALIAS: {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+        }):
+            assert [error.id for error in check_auth_cache(None)] == ['api.E001'], (
+                'Проверьте, что аутентификация по данным токена требует общего кэша'
+            )
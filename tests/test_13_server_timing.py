@@ -0,0 +1,69 @@
+import json
+import logging
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from .common import create_reviews
+
+
+def parse_server_timing(header):
+    metrics = {}
+    for metric in header.split(', '):
+        name, *params = metric.split(';')
+        metrics[name] = dict(param.split('=', 1) for param in params)
+    return metrics
+
+
+class Test13ServerTiming:
+
+    @pytest.mark.django_db(transaction=True)
+    def test_01_server_timing_disabled(self, client, settings):
+        settings.SERVER_TIMING_ENABLED = False
+        settings.SERVER_TIMING_SAMPLE_RATE = 1
+        response = client.get('/api/v1/titles/')
+        assert 'Server-Timing' not in response, (
+            'Проверьте, что без включённой настройки `SERVER_TIMING_ENABLED` '
+            'заголовок `Server-Timing` не добавляется'
+        )
+        settings.SERVER_TIMING_ENABLED = True
+        settings.SERVER_TIMING_SAMPLE_RATE = 0
+        response = client.get('/api/v1/titles/')
+        assert 'Server-Timing' not in response, (
+            'Проверьте, что запросы вне выборки `SERVER_TIMING_SAMPLE_RATE` '
+            'не замеряются'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_02_server_timing_header(self, client, admin_client, admin,
+                                     settings, caplog):
+        _, titles, _, _ = create_reviews(admin_client, admin)
+        settings.SERVER_TIMING_ENABLED = True
+        settings.SERVER_TIMING_SAMPLE_RATE = 1
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+        with caplog.at_level(logging.INFO, logger='api.timing'):
+            with CaptureQueriesContext(connection) as queries:
+                response = client.get(url)
+        assert response.status_code == 200
+        metrics = parse_server_timing(response['Server-Timing'])
+        for name in ('db', 'auth', 'serialize', 'render', 'view', 'total'):
+            assert name in metrics and float(metrics[name]['dur']) >= 0, (
+                f'Проверьте, что заголовок `Server-Timing` содержит `{name}`'
+            )
+        assert metrics['db']['desc'] == f'"{len(queries)} queries"', (
+            'Проверьте, что `Server-Timing` содержит число SQL запросов'
+        )
+        records = [
+            json.loads(record.getMessage()) for record in caplog.records
+            if record.name == 'api.timing'
+        ]
+        assert len(records) == 1, (
+            'Проверьте, что на каждый замеренный запрос пишется одна строка лога'
+        )
+        assert records[0]['path'] == url and records[0]['status'] == 200, (
+            'Проверьте, что строка лога содержит путь и статус ответа'
+        )
+        assert records[0]['queries'] == len(queries), (
+            'Проверьте, что строка лога содержит число SQL запросов'
+        )
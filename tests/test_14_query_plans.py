@@ -0,0 +1,102 @@
+from datetime import datetime, timezone
+
+import pytest
+from django.db import connection
+from django.db.models import Q
+from reviews.models import Comment, Review, Title
+
+CURSOR_DATE = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+HOT_QUERIES = (
+    (
+        'список отзывов',
+        lambda: Review.objects.filter(title_id=1)[:10],
+        'reviews_review', 'review_title_pub_date_idx',
+    ),
+    (
+        'список отзывов по курсору',
+        lambda: Review.objects.filter(title_id=1).filter(
+            Q(pub_date__lt=CURSOR_DATE) | Q(pub_date=CURSOR_DATE, id__lt=1)
+        ).order_by('-pub_date', '-id')[:11],
+        'reviews_review', 'review_title_pub_date_idx',
+    ),
+    (
+        'список комментариев',
+        lambda: Comment.objects.filter(review_id=1)[:10],
+        'reviews_comment', 'comment_review_pub_date_idx',
+    ),
+    (
+        'список комментариев по курсору',
+        lambda: Comment.objects.filter(review_id=1).filter(
+            Q(pub_date__gt=CURSOR_DATE) | Q(pub_date=CURSOR_DATE, id__gt=1)
+        ).order_by('pub_date', 'id')[:11],
+        'reviews_comment', 'comment_review_pub_date_idx',
+    ),
+    (
+        'фильтр произведений по году',
+        lambda: Title.objects.filter(year=2000)[:10],
+        'reviews_title', 'title_year_idx',
+    ),
+    (
+        'фильтр произведений по категории',
+        lambda: Title.objects.filter(category__slug='movie')[:10],
+        'reviews_title', 'category_id',
+    ),
+    (
+        'сортировка произведений по названию',
+        lambda: Title.objects.order_by('name')[:10],
+        'reviews_title', 'title_name_idx',
+    ),
+    (
+        'сортировка произведений по рейтингу',
+        lambda: Title.objects.order_by('-rating', '-id')[:10],
+        'reviews_title', 'title_rating_idx',
+    ),
+    (
+        'сортировка произведений по числу отзывов',
+        lambda: Title.objects.order_by('-reviews_count', '-id')[:10],
+        'reviews_title', 'title_reviews_count_idx',
+    ),
+    (
+        'сортировка произведений по году',
+        lambda: Title.objects.order_by('year', 'id')[:10],
+        'reviews_title', 'title_year_idx',
+    ),
+    (
+        'лучшие произведения по взвешенному рейтингу',
+        lambda: Title.objects.filter(
+            ranking__weighted_rating__isnull=False
+        ).order_by('-ranking__weighted_rating', 'ranking__title')[:10],
+        'reviews_titleranking', 'title_ranking_idx',
+    ),
+)
+
+
+def explain(queryset):
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+        return [row[-1] for row in cursor.fetchall()]
+
+
+@pytest.mark.skipif(
+    connection.vendor != 'sqlite', reason='EXPLAIN QUERY PLAN есть только в SQLite'
+)
+class Test14QueryPlans:
+
+    @pytest.mark.django_db(transaction=True)
+    @pytest.mark.parametrize('description,queryset,table,index', HOT_QUERIES)
+    def test_01_hot_queries_use_index(self, description, queryset, table,
+                                      index):
+        plan = explain(queryset())
+        table_steps = [step for step in plan if f' {table} ' in step]
+        assert table_steps and all(
+            'USING' in step and index in step for step in table_steps
+        ), (
+            f'Проверьте, что запрос "{description}" читает `{table}` '
+            f'по индексу `{index}`, а не полным сканированием: {plan}'
+        )
+        assert not any('TEMP B-TREE' in step for step in plan), (
+            f'Проверьте, что запрос "{description}" не сортирует строки '
+            f'во временном B-дереве: {plan}'
+        )
@@ -0,0 +1,131 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from reviews.models import Title, TitleQuerySet
+
+from .common import create_titles
+
+
+def bulk_payload(count, genres, categories, start=0):
+    return [
+        {
+            'name': f'Пакет {i}', 'year': 2000 + i % 20,
+            'genre': [genres[i % len(genres)]['slug'], genres[0]['slug']],
+            'category': categories[i % len(categories)]['slug'],
+            'description': f'Описание {i}',
+        }
+        for i in range(start, start + count)
+    ]
+
+
+class Test15TitlesBulk:
+    url = '/api/v1/titles/bulk/'
+
+    @pytest.mark.django_db(transaction=True)
+    def test_01_bulk_permissions(self, client, user_client):
+        for api_client in (client, user_client):
+            response = api_client.post(self.url, data='[]', content_type='application/json')
+            assert response.status_code in (401, 403), (
+                f'Проверьте, что POST запрос `{self.url}` доступен только администратору'
+            )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_02_bulk_create_and_upsert(self, client, admin_client):
+        titles, categories, genres = create_titles(admin_client)
+        data = bulk_payload(3, genres, categories)
+        response = admin_client.post(self.url, data=data, format='json')
+        assert response.status_code == 200, (
+            f'Проверьте, что POST запрос `{self.url}` администратора возвращает статус 200'
+        )
+        results = response.json()
+        assert [(item['name'], item['year'], item['created']) for item in results] == [
+            (item['name'], item['year'], True) for item in data
+        ], (
+            f'Проверьте, что POST запрос `{self.url}` возвращает результат для каждого произведения по порядку'
+        )
+        detail = client.get(f'/api/v1/titles/{results[1]["id"]}/').json()
+        assert detail['name'] == data[1]['name'] and {genre['slug'] for genre in detail['genre']} == set(
+            data[1]['genre']
+        ) and detail['category']['slug'] == data[1]['category'], (
+            f'Проверьте, что POST запрос `{self.url}` сохраняет жанры и категорию произведения'
+        )
+        data[1]['description'] = 'Новое описание'
+        data[1]['genre'] = [genres[2]['slug']]
+        data.append({
+            'name': titles[0]['name'], 'year': titles[0]['year'], 'genre': [genres[1]['slug']],
+            'category': categories[1]['slug'],
+        })
+        response = admin_client.post(self.url, data=data[1:], format='json')
+        results = response.json()
+        assert response.status_code == 200 and [item['created'] for item in results] == [False, False, False], (
+            f'Проверьте, что POST запрос `{self.url}` обновляет произведения с тем же названием и годом'
+        )
+        assert results[2]['id'] == titles[0]['id'] and Title.objects.count() == 5, (
+            f'Проверьте, что POST запрос `{self.url}` не создаёт дубликаты существующих произведений'
+        )
+        detail = client.get(f'/api/v1/titles/{results[0]["id"]}/').json()
+        assert detail['description'] == 'Новое описание' and [genre['slug'] for genre in detail['genre']] == [
+            genres[2]['slug']
+        ], (
+            f'Проверьте, что POST запрос `{self.url}` заменяет описание и жанры обновлённого произведения'
+        )
+        assert Title.objects.get(pk=titles[0]['id']).description == titles[0]['description'], (
+            f'Проверьте, что POST запрос `{self.url}` не затирает описание, если оно не передано'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_03_bulk_validation(self, admin_client):
+        _, categories, genres = create_titles(admin_client)
+        data = bulk_payload(3, genres, categories)
+        data[0]['genre'] = ['missing-genre']
+        data[1]['category'] = 'missing-category'
+        data[2]['name'] = data[0]['name']
+        data[2]['year'] = data[0]['year']
+        response = admin_client.post(self.url, data=data, format='json')
+        assert response.status_code == 400, (
+            f'Проверьте, что POST запрос `{self.url}` с неверными данными возвращает статус 400'
+        )
+        errors = response.json()
+        assert 'genre' in errors[0] and 'category' in errors[1] and 'name' in errors[2], (
+            f'Проверьте, что POST запрос `{self.url}` возвращает ошибки для каждого произведения'
+        )
+        assert Title.objects.count() == 2, (
+            f'Проверьте, что POST запрос `{self.url}` с ошибками не сохраняет произведения'
+        )
+        response = admin_client.post(self.url, data={'name': 'Не список'}, format='json')
+        assert response.status_code == 400, (
+            f'Проверьте, что POST запрос `{self.url}` принимает только список произведений'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_04_bulk_query_count(self, admin_client):
+        _, categories, genres = create_titles(admin_client)
+        queries = []
+        for start, count in ((0, 5), (5, 50)):
+            data = bulk_payload(count, genres, categories, start)
+            with CaptureQueriesContext(connection) as context:
+                response = admin_client.post(self.url, data=data, format='json')
+            assert response.status_code == 200
+            queries.append(len(context))
+        assert queries[0] == queries[1], (
+            f'Проверьте, что число SQL запросов POST запроса `{self.url}` не зависит от числа произведений'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_05_bulk_created_ids(self, admin_client, monkeypatch):
+        _, categories, genres = create_titles(admin_client)
+        data = bulk_payload(2, genres, categories)
+        bulk_create = TitleQuerySet.bulk_create
+
+        def concurrent_bulk_create(queryset, objs, *args, **kwargs):
+            Title.objects.create(name=data[0]['name'], year=data[0]['year'])
+            Title.objects.create(name='Другое произведение', year=2000)
+            return bulk_create(queryset, objs, *args, **kwargs)
+
+        monkeypatch.setattr(TitleQuerySet, 'bulk_create', concurrent_bulk_create)
+        results = admin_client.post(self.url, data=data, format='json').json()
+        for item, result in zip(data, results):
+            title = Title.objects.get(pk=result['id'])
+            assert (title.name, title.description) == (item['name'], item['description']), (
+                f'Проверьте, что POST запрос `{self.url}` возвращает идентификаторы созданных им произведений'
+            )
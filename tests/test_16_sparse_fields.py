@@ -0,0 +1,67 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from .common import create_comments, create_titles
+
+
+class Test16SparseFields:
+
+    @pytest.mark.django_db(transaction=True)
+    def test_01_titles_fields(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        url = '/api/v1/titles/?fields=id,name,rating'
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(url)
+        results = response.json()['results']
+        assert [set(title) for title in results] == [{'id', 'name', 'rating'}] * 2, (
+            f'Проверьте, что GET запрос `{url}` возвращает только запрошенные поля'
+        )
+        sql = ' '.join(query['sql'] for query in context.captured_queries)
+        assert 'description' not in sql and 'reviews_genre' not in sql and 'reviews_category' not in sql, (
+            f'Проверьте, что GET запрос `{url}` не загружает из базы незапрошенные поля и связи'
+        )
+        url = '/api/v1/titles/?omit=description,genre'
+        results = client.get(url).json()['results']
+        assert set(results[0]) == {'id', 'name', 'year', 'rating', 'category'}, (
+            f'Проверьте, что GET запрос `{url}` не возвращает исключённые поля'
+        )
+        assert results[0]['category']['slug'] == titles[0]['category'], (
+            f'Проверьте, что GET запрос `{url}` возвращает связанную категорию'
+        )
+        url = f'/api/v1/titles/{titles[1]["id"]}/?fields=name,genre,unknown'
+        data = client.get(url).json()
+        assert set(data) == {'name', 'genre'} and [genre['slug'] for genre in data['genre']] == titles[1]['genre'], (
+            f'Проверьте, что GET запрос `{url}` возвращает только известные запрошенные поля'
+        )
+        full = client.get('/api/v1/titles/').json()['results'][0]
+        assert set(full) == {'id', 'name', 'year', 'rating', 'description', 'genre', 'category'}, (
+            'Проверьте, что без параметров `fields` и `omit` возвращаются все поля произведения'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_02_reviews_and_comments_fields(self, client, admin_client, admin):
+        _, reviews, titles, _, _ = create_comments(admin_client, admin)
+        title_id = titles[0]['id']
+        url = f'/api/v1/titles/{title_id}/reviews/?fields=id,score,author'
+        results = client.get(url).json()['results']
+        assert {(review['id'], review['score'], review['author']) for review in results} == {
+            (review['id'], review['score'], review['author']) for review in reviews
+        } and all(set(review) == {'id', 'score', 'author'} for review in results), (
+            f'Проверьте, что GET запрос `{url}` возвращает только запрошенные поля отзывов'
+        )
+        url = f'/api/v1/titles/{title_id}/reviews/?cursor=&omit=text'
+        with CaptureQueriesContext(connection) as context:
+            data = client.get(url).json()
+        assert len(data['results']) == 3 and 'text' not in data['results'][0], (
+            f'Проверьте, что GET запрос `{url}` работает вместе с постраничным выводом по курсору'
+        )
+        assert len(context) <= 3, (
+            f'Проверьте, что GET запрос `{url}` не делает отдельных запросов для каждого отзыва'
+        )
+        review_id = reviews[0]['id']
+        url = f'/api/v1/titles/{title_id}/reviews/{review_id}/comments/?fields=text'
+        results = client.get(url).json()['results']
+        assert results and all(list(comment) == ['text'] for comment in results), (
+            f'Проверьте, что GET запрос `{url}` возвращает только запрошенные поля комментариев'
+        )
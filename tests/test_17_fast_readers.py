@@ -0,0 +1,61 @@
+import pytest
+from api import cache
+from api.views import CommentViewSet, ReviewViewSet, TitleViewSet
+from reviews.models import Title
+
+from .common import create_comments
+
+
+class Test17FastReaders:
+
+    def get_both(self, client, monkeypatch, view, url):
+        cache.clear()
+        fast = client.get(url)
+        cache.clear()
+        with monkeypatch.context() as patch:
+            patch.setattr(view, 'reader_class', None)
+            regular = client.get(url)
+        return fast, regular
+
+    @pytest.mark.django_db(transaction=True)
+    def test_01_fast_readers_parity(self, client, admin_client, admin, monkeypatch):
+        _, reviews, titles, _, _ = create_comments(admin_client, admin)
+        Title.objects.create(name='Без категории', year=1999)
+        title_url = f'/api/v1/titles/{titles[0]["id"]}/'
+        cases = (
+            (TitleViewSet, '/api/v1/titles/'),
+            (TitleViewSet, '/api/v1/titles/?ordering=-rating&limit=2&offset=1'),
+            (TitleViewSet, '/api/v1/titles/?genre=horror'),
+            (TitleViewSet, '/api/v1/titles/?search=драма'),
+            (TitleViewSet, '/api/v1/titles/?fields=id,genre,rating'),
+            (TitleViewSet, '/api/v1/titles/?fields=id,score_distribution'),
+            (ReviewViewSet, f'{title_url}reviews/'),
+            (ReviewViewSet, f'{title_url}reviews/?cursor=&limit=2'),
+            (ReviewViewSet, f'{title_url}reviews/?omit=text'),
+            (ReviewViewSet, f'{title_url}reviews/?expand=author'),
+            (ReviewViewSet, f'{title_url}reviews/?fields=author,score&expand=author'),
+            (CommentViewSet, f'{title_url}reviews/{reviews[0]["id"]}/comments/'),
+            (CommentViewSet, f'{title_url}reviews/{reviews[0]["id"]}/comments/?fields=author,pub_date'),
+            (CommentViewSet, f'{title_url}reviews/{reviews[0]["id"]}/comments/?expand=author'),
+        )
+        for view, url in cases:
+            fast, regular = self.get_both(client, monkeypatch, view, url)
+            assert fast.status_code == regular.status_code == 200
+            assert fast.content == regular.content, (
+                f'Проверьте, что GET запрос `{url}` быстрым способом возвращает тот же JSON, '
+                'что и сериализатор'
+            )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_02_fast_readers_cursor(self, client, admin_client, admin, monkeypatch):
+        _, _, titles, _, _ = create_comments(admin_client, admin)
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/?cursor=&limit=1'
+        fast, regular = self.get_both(client, monkeypatch, ReviewViewSet, url)
+        next_url = fast.json()['next']
+        assert next_url and next_url == regular.json()['next'], (
+            f'Проверьте, что GET запрос `{url}` быстрым способом возвращает ту же ссылку на следующую страницу'
+        )
+        fast, regular = self.get_both(client, monkeypatch, ReviewViewSet, next_url)
+        assert fast.content == regular.content, (
+            'Проверьте, что следующая страница отзывов быстрым способом совпадает с ответом сериализатора'
+        )
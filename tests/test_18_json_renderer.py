@@ -0,0 +1,105 @@
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from io import BytesIO
+
+import pytest
+from api import parsers, renderers
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+DATA = {
+    'count': 2,
+    'next': None,
+    'results': [
+        {
+            'id': 1,
+            'name': 'Война и мир',
+            'rating': 7,
+            'score': 7.25,
+            'description': 'Строка\u2028с разделителем\u2029строк — и тире',
+            'genre': [{'name': 'Драма', 'slug': 'drama'}],
+            'category': None,
+            'pub_date': datetime(2021, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+        },
+        {
+            'id': 2,
+            'pub_date': datetime(2021, 5, 1, 12, 30, tzinfo=timezone(timedelta(hours=3))),
+            'naive': datetime(2021, 5, 1, 12, 30),
+            'date': date(2021, 5, 1),
+            'price': Decimal('9.90'),
+            'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'lazy': gettext_lazy('Текст'),
+            'tuple': (1, 2),
+            'scores': {1: 0, 10: 5},
+        },
+    ],
+}
+
+
+class Test18JSONRenderer:
+
+    @pytest.mark.parametrize('use_orjson', (True, False))
+    def test_01_renderer_parity(self, monkeypatch, use_orjson):
+        if not use_orjson:
+            monkeypatch.setattr(renderers, 'orjson', None)
+        elif renderers.orjson is None:
+            pytest.skip('orjson не установлен')
+        expected = JSONRenderer().render(DATA)
+        assert renderers.FastJSONRenderer().render(DATA) == expected, (
+            'Проверьте, что `FastJSONRenderer` возвращает те же байты, что и `JSONRenderer`'
+        )
+        indented = JSONRenderer().render(DATA, 'application/json; indent=4')
+        assert renderers.FastJSONRenderer().render(DATA, 'application/json; indent=4') == indented, (
+            'Проверьте, что `FastJSONRenderer` поддерживает параметр `indent`'
+        )
+        assert renderers.FastJSONRenderer().render(None) == b''
+
+    @pytest.mark.parametrize('use_orjson', (True, False))
+    def test_02_renderer_floats(self, monkeypatch, use_orjson):
+        if not use_orjson:
+            monkeypatch.setattr(renderers, 'orjson', None)
+        elif renderers.orjson is None:
+            pytest.skip('orjson не установлен')
+        for data in (
+            {'results': [{'weighted_rating': 1e16}, {'weighted_rating': 1.5e-05}]},
+            [0.1, -0.0, 1e22, 123456789012345.6],
+            {'price': Decimal('1E+16')},
+            2.5,
+        ):
+            assert renderers.FastJSONRenderer().render(data) == JSONRenderer().render(data), (
+                f'Проверьте, что `FastJSONRenderer` записывает числа {data} так же, как `JSONRenderer`'
+            )
+        for value in (float('nan'), float('inf'), float('-inf')):
+            with pytest.raises(ValueError):
+                JSONRenderer().render({'rating': value})
+            with pytest.raises(ValueError):
+                renderers.FastJSONRenderer().render({'results': [{'rating': value}]})
+
+    @pytest.mark.parametrize('use_orjson', (True, False))
+    def test_03_parser(self, monkeypatch, use_orjson):
+        if not use_orjson:
+            monkeypatch.setattr(parsers, 'orjson', None)
+        content = '{"name": "Война и мир", "genre": ["drama"], "year": 1869}'.encode()
+        assert parsers.FastJSONParser().parse(BytesIO(content)) == JSONParser().parse(BytesIO(content)), (
+            'Проверьте, что `FastJSONParser` разбирает JSON так же, как `JSONParser`'
+        )
+        with pytest.raises(ParseError):
+            parsers.FastJSONParser().parse(BytesIO(b'{"name": NaN}'))
+        with pytest.raises(ParseError):
+            parsers.FastJSONParser().parse(BytesIO(b'{"name":'))
+
+    @pytest.mark.django_db(transaction=True)
+    def test_04_api_json(self, admin_client):
+        response = admin_client.post('/api/v1/genres/', data={'name': 'Драма', 'slug': 'drama'}, format='json')
+        assert response.status_code == 201, (
+            'Проверьте, что API принимает JSON в теле запроса'
+        )
+        response = admin_client.get('/api/v1/genres/')
+        assert response['Content-Type'] == 'application/json' and response.json()['results'] == [
+            {'name': 'Драма', 'slug': 'drama'}
+        ], (
+            'Проверьте, что API возвращает JSON'
+        )
@@ -0,0 +1,63 @@
+import pytest
+from django.core.management import call_command
+from reviews.models import Title
+
+from .common import assert_max_queries, create_reviews
+
+
+def distribution(**counts):
+    return {str(score): counts.get(f's{score}', 0) for score in range(1, 11)}
+
+
+class Test19ScoreDistribution:
+
+    @pytest.mark.django_db(transaction=True)
+    def test_01_score_distribution(self, client, admin_client, admin):
+        reviews, titles, _, _ = create_reviews(admin_client, admin)
+        title_url = f'/api/v1/titles/{titles[0]["id"]}/'
+        url = f'{title_url}score-distribution/'
+        with assert_max_queries(1, url):
+            response = client.get(url)
+        assert response.status_code == 200 and response.json() == {
+            'reviews_count': 3, 'score_distribution': distribution(s3=1, s4=1, s5=1)
+        }, (
+            f'Проверьте, что GET запрос `{url}` возвращает число отзывов по каждой оценке'
+        )
+        admin_client.patch(f'{title_url}reviews/{reviews[0]["id"]}/', data={'score': 10})
+        admin_client.delete(f'{title_url}reviews/{reviews[1]["id"]}/')
+        assert client.get(url).json() == {
+            'reviews_count': 2, 'score_distribution': distribution(s4=1, s10=1)
+        }, (
+            f'Проверьте, что GET запрос `{url}` учитывает изменение и удаление отзывов'
+        )
+        empty_url = f'/api/v1/titles/{titles[1]["id"]}/score-distribution/'
+        assert client.get(empty_url).json()['score_distribution'] == distribution(), (
+            f'Проверьте, что GET запрос `{empty_url}` для произведения без отзывов возвращает нули'
+        )
+        assert client.get('/api/v1/titles/0/score-distribution/').status_code == 404
+
+    @pytest.mark.django_db(transaction=True)
+    def test_02_score_distribution_field(self, client, admin_client, admin):
+        _, titles, _, _ = create_reviews(admin_client, admin)
+        title_url = f'/api/v1/titles/{titles[0]["id"]}/'
+        assert 'score_distribution' not in client.get(title_url).json(), (
+            'Проверьте, что поле `score_distribution` не возвращается без запроса'
+        )
+        data = client.get(f'{title_url}?fields=id,score_distribution').json()
+        assert data == {'id': titles[0]['id'], 'score_distribution': distribution(s3=1, s4=1, s5=1)}, (
+            'Проверьте, что поле `score_distribution` возвращается при запросе `?fields=score_distribution`'
+        )
+        results = client.get('/api/v1/titles/?fields=id,score_distribution').json()['results']
+        assert results[0]['score_distribution'] == distribution(s3=1, s4=1, s5=1), (
+            'Проверьте, что поле `score_distribution` доступно в списке произведений'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_03_rebuild_score_distribution(self, client, admin_client, admin):
+        _, titles, _, _ = create_reviews(admin_client, admin)
+        Title.objects.update(score_3=0, score_4=7, score_5=0)
+        call_command('rebuild_score_distribution')
+        url = f'/api/v1/titles/{titles[0]["id"]}/score-distribution/'
+        assert client.get(url).json()['score_distribution'] == distribution(s3=1, s4=1, s5=1), (
+            'Проверьте, что команда `rebuild_score_distribution` пересчитывает оценки по отзывам'
+        )
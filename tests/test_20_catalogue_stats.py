@@ -0,0 +1,87 @@
+import pytest
+from api.cache import single_flight
+from django.core.management import call_command
+from reviews.models import Genre, GenreStats, Title
+
+from .common import assert_max_queries, create_reviews
+
+
+def stats(response):
+    return [
+        (item['slug'], item['titles_count'], item['reviews_count'], item['rating'])
+        for item in response.json()
+    ]
+
+
+class Test20CatalogueStats:
+
+    @pytest.mark.django_db(transaction=True)
+    def test_01_catalogue_stats(self, client, admin_client, admin):
+        create_reviews(admin_client, admin)
+        response = client.get('/api/v1/genres/stats/')
+        assert response.status_code == 200 and stats(response) == [
+            ('drama', 1, 0, None), ('comedy', 1, 3, 4.0), ('horror', 1, 3, 4.0)
+        ], (
+            'Проверьте, что GET запрос `/api/v1/genres/stats/` возвращает число произведений, '
+            'отзывов и средний рейтинг по жанрам'
+        )
+        response = client.get('/api/v1/categories/stats/')
+        assert response.status_code == 200 and stats(response) == [
+            ('books', 1, 0, None), ('films', 1, 3, 4.0)
+        ], (
+            'Проверьте, что GET запрос `/api/v1/categories/stats/` возвращает число произведений, '
+            'отзывов и средний рейтинг по категориям'
+        )
+        response = client.get('/api/v1/genres/stats/?search=Драма')
+        assert stats(response) == [('drama', 1, 0, None)], (
+            'Проверьте, что GET запрос `/api/v1/genres/stats/` поддерживает поиск по названию'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_02_catalogue_stats_staleness(self, client, admin_client, admin, settings):
+        create_reviews(admin_client, admin)
+        url = '/api/v1/genres/stats/'
+        client.get(url)
+        with assert_max_queries(1, url):
+            client.get(url)
+        Title.objects.create(name='Новинка', year=2001).genre.add(
+            Genre.objects.get(slug='drama')
+        )
+        assert stats(client.get(url))[0] == ('drama', 1, 0, None), (
+            f'Проверьте, что GET запрос `{url}` читает статистику из сводной таблицы'
+        )
+        settings.CATALOGUE_STATS_MAX_AGE = 0
+        assert stats(client.get(url))[0] == ('drama', 2, 0, None), (
+            f'Проверьте, что GET запрос `{url}` обновляет устаревшую статистику'
+        )
+        Title.objects.create(name='Ещё новинка', year=2002).genre.add(
+            Genre.objects.get(slug='drama')
+        )
+        with single_flight('reviews.genrestats', 60):
+            with assert_max_queries(1, url):
+                response = client.get(url)
+        assert stats(response)[0] == ('drama', 2, 0, None), (
+            f'Проверьте, что GET запрос `{url}` отдаёт устаревшую статистику, пока её обновляет другой запрос'
+        )
+        admin_client.post('/api/v1/genres/', data={'name': 'Аниме', 'slug': 'anime'})
+        with single_flight('reviews.genrestats', 60):
+            response = client.get(url)
+        assert response.json()[0] == {
+            'name': 'Аниме', 'slug': 'anime', 'titles_count': 0,
+            'reviews_count': 0, 'rating': None, 'refreshed': None
+        }, (
+            f'Проверьте, что GET запрос `{url}` отдаёт нулевые счётчики для нового жанра, '
+            'пока статистику обновляет другой запрос'
+        )
+        settings.CATALOGUE_STATS_MAX_AGE = 300
+        assert stats(client.get(url))[0] == ('anime', 0, 0, None), (
+            f'Проверьте, что GET запрос `{url}` обновляет статистику для новых жанров'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_03_refresh_catalogue_stats(self, admin_client, admin):
+        create_reviews(admin_client, admin)
+        call_command('refresh_catalogue_stats')
+        assert GenreStats.objects.filter(genre__slug='horror', titles_count=1, reviews_count=3).exists(), (
+            'Проверьте, что команда `refresh_catalogue_stats` пересчитывает статистику жанров'
+        )
@@ -0,0 +1,106 @@
+import pytest
+from django.core.management import call_command
+from reviews.models import (Genre, Review, Title, TitleRanking,
+                            TitleRankingQuerySet, User)
+
+from .common import assert_max_queries, create_reviews, title_ranking_mismatches
+
+TITLES_COUNT = 600
+
+
+def create_rated_title(name, year, scores):
+    title = Title.objects.create(name=name, year=year)
+    for index, score in enumerate(scores):
+        author = User.objects.create(username=f'{name}{index}', email=f'{name}{index}@yamdb.fake')
+        Review.objects.create(author=author, title=title, text='Отзыв', score=score)
+    return title
+
+
+class Test21TopTitles:
+
+    @pytest.mark.django_db(transaction=True)
+    def test_01_top_titles(self, client, admin_client, admin):
+        _, titles, _, _ = create_reviews(admin_client, admin)
+        single = create_rated_title('single', 2010, [10])
+        classic = create_rated_title('classic', 1990, [8] * 12)
+        classic.genre.add(Genre.objects.get(slug='drama'))
+        url = '/api/v1/titles/top/'
+        with assert_max_queries(3, url):
+            response = client.get(url)
+        assert response.status_code == 200
+        data = response.json()
+        assert [title['id'] for title in data['results']] == [classic.id, single.id, titles[0]['id']], (
+            f'Проверьте, что GET запрос `{url}` сортирует произведения по взвешенному рейтингу '
+            'и не возвращает произведения без отзывов'
+        )
+        assert data['count'] == 3 and data['results'][0]['weighted_rating'] == pytest.approx(151 / 22), (
+            f'Проверьте, что GET запрос `{url}` возвращает взвешенный рейтинг'
+        )
+        assert data['results'][0]['genre'] == [{'name': 'Драма', 'slug': 'drama'}]
+        response = client.get(f'{url}?genre=drama')
+        assert [title['id'] for title in response.json()['results']] == [classic.id], (
+            f'Проверьте, что GET запрос `{url}` фильтрует произведения по жанру'
+        )
+        response = client.get(f'{url}?year=2010')
+        assert [title['id'] for title in response.json()['results']] == [single.id], (
+            f'Проверьте, что GET запрос `{url}` фильтрует произведения по году'
+        )
+        Title.objects.filter(pk=single.pk).update(description='Драма')
+        Title.objects.filter(pk=classic.pk).update(description='Длинная история, в которой есть и драма')
+        response = client.get(f'{url}?search=драма')
+        assert [title['id'] for title in response.json()['results']] == [classic.id, single.id], (
+            f'Проверьте, что GET запрос `{url}` с поиском сохраняет сортировку по взвешенному рейтингу'
+        )
+        Review.objects.filter(title=single).delete()
+        response = client.get(url)
+        assert [title['id'] for title in response.json()['results']] == [classic.id, titles[0]['id']], (
+            f'Проверьте, что GET запрос `{url}` учитывает удаление отзывов'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_02_rebuild_title_ranking(self, client, admin_client, admin):
+        create_reviews(admin_client, admin)
+        classic = create_rated_title('classic', 1990, [8] * 12)
+        call_command('rebuild_title_ranking')
+        mean = (12 + 96) / 15
+        response = client.get('/api/v1/titles/top/')
+        assert response.json()['results'][0]['weighted_rating'] == pytest.approx((96 + mean * 10) / 22), (
+            'Проверьте, что команда `rebuild_title_ranking` пересчитывает среднюю оценку и рейтинг'
+        )
+        author = User.objects.create(username='late', email='late@yamdb.fake')
+        Review.objects.create(author=author, title=classic, text='Отзыв', score=1)
+        response = client.get('/api/v1/titles/top/')
+        assert response.json()['results'][0]['weighted_rating'] == pytest.approx((97 + mean * 10) / 23), (
+            'Проверьте, что новые отзывы обновляют рейтинг с учётом сохранённой средней оценки'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_03_rebuild_large_title_ranking(self, admin):
+        Title.objects.bulk_create(Title(name=f'Произведение {i}', year=2000) for i in range(TITLES_COUNT))
+        Review.objects.bulk_create(
+            Review(author=admin, title=title, text='Отзыв', score=index % 10 + 1)
+            for index, title in enumerate(Title.objects.all())
+        )
+        Title.objects.all().recalculate_rating()
+        call_command('rebuild_title_ranking')
+        assert TitleRanking.objects.count() == TITLES_COUNT and not title_ranking_mismatches(), (
+            f'Проверьте, что команда `rebuild_title_ranking` строит рейтинг для {TITLES_COUNT} произведений'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_04_add_title_race(self, monkeypatch):
+        title = create_rated_title('classic', 1990, [8])
+        rank_titles = TitleRankingQuerySet.rank_titles
+        calls = []
+
+        def racing_rank_titles(queryset, title_ids):
+            calls.append(title_ids)
+            if len(calls) == 1:
+                return 0
+            return rank_titles(queryset, title_ids)
+
+        monkeypatch.setattr(TitleRankingQuerySet, 'rank_titles', racing_rank_titles)
+        TitleRanking.objects.add_title(title.pk)
+        assert TitleRanking.objects.filter(title=title, weighted_rating__isnull=False).count() == 1, (
+            'Проверьте, что добавление произведения в рейтинг переживает одновременное создание строки рейтинга'
+        )
@@ -0,0 +1,77 @@
+import pytest
+from api import cache
+from api.views import CommentViewSet, ReviewViewSet
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from reviews.models import Comment, Review, Title, User
+
+REVIEWS_COUNT = 12
+
+
+def create_feed():
+    title = Title.objects.create(name='Произведение', year=2000)
+    users = [
+        User.objects.create(username=f'reader{i}', email=f'reader{i}@yamdb.fake')
+        for i in range(REVIEWS_COUNT)
+    ]
+    reviews = [
+        Review.objects.create(author=user, title=title, text='Отзыв', score=5)
+        for user in users
+    ]
+    for user in users:
+        Comment.objects.create(author=user, review=reviews[0], text='Комментарий')
+    return title, reviews
+
+
+def count_queries(client, url):
+    cache.clear()
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+    assert response.status_code == 200
+    return len(context)
+
+
+class Test22ExpandAuthor:
+
+    @pytest.mark.django_db(transaction=True)
+    @pytest.mark.parametrize('use_reader', (True, False))
+    def test_01_feed_queries_independent_of_page_size(self, client, monkeypatch, use_reader):
+        title, reviews = create_feed()
+        if not use_reader:
+            monkeypatch.setattr(ReviewViewSet, 'reader_class', None)
+            monkeypatch.setattr(CommentViewSet, 'reader_class', None)
+        urls = (
+            f'/api/v1/titles/{title.pk}/reviews/',
+            f'/api/v1/titles/{title.pk}/reviews/?expand=author',
+            f'/api/v1/titles/{title.pk}/reviews/{reviews[0].pk}/comments/',
+            f'/api/v1/titles/{title.pk}/reviews/{reviews[0].pk}/comments/?expand=author',
+        )
+        for url in urls:
+            separator = '&' if '?' in url else '?'
+            small = count_queries(client, f'{url}{separator}limit=2')
+            large = count_queries(client, f'{url}{separator}limit={REVIEWS_COUNT}')
+            assert small == large, (
+                f'Проверьте, что GET запрос `{url}` загружает авторов одним запросом: '
+                f'{small} запросов для 2 записей и {large} для {REVIEWS_COUNT}'
+            )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_02_expand_author(self, client):
+        title, reviews = create_feed()
+        url = f'/api/v1/titles/{title.pk}/reviews/?expand=author'
+        results = client.get(url).json()['results']
+        assert results[0]['author'] == {'username': 'reader11', 'role': 'user'}, (
+            f'Проверьте, что GET запрос `{url}` возвращает автора объектом с полями `username` и `role`'
+        )
+        url = f'/api/v1/titles/{title.pk}/reviews/{reviews[0].pk}/?expand=author'
+        assert client.get(url).json()['author'] == {'username': 'reader0', 'role': 'user'}
+        url = f'/api/v1/titles/{title.pk}/reviews/?fields=id,author&expand=author,unknown'
+        assert client.get(url).json()['results'][0] == {
+            'id': reviews[-1].pk, 'author': {'username': 'reader11', 'role': 'user'}
+        }, (
+            'Проверьте, что параметр `expand` работает вместе с `fields` и пропускает неизвестные поля'
+        )
+        url = f'/api/v1/titles/{title.pk}/reviews/'
+        assert client.get(url).json()['results'][0]['author'] == 'reader11', (
+            f'Проверьте, что GET запрос `{url}` без `expand` возвращает username автора'
+        )
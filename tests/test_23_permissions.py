@@ -0,0 +1,56 @@
+import pytest
+from reviews.models import Comment, Review, Title
+
+from .common import assert_max_queries, auth_client, create_comments
+
+REVIEW_CHANGE_BUDGET = 4
+COMMENT_CHANGE_BUDGET = 2
+
+
+class Test23Permissions:
+
+    @pytest.mark.django_db(transaction=True)
+    def test_01_change_query_budget(self, admin_client, admin):
+        comments, reviews, titles, user, _ = create_comments(admin_client, admin)
+        client = auth_client(user)
+        review_url = f'/api/v1/titles/{titles[0]["id"]}/reviews/{reviews[1]["id"]}/'
+        comment_url = f'/api/v1/titles/{titles[0]["id"]}/reviews/{reviews[0]["id"]}/comments/{comments[1]["id"]}/'
+        client.get(review_url)
+        for url, budget in ((review_url, REVIEW_CHANGE_BUDGET), (comment_url, COMMENT_CHANGE_BUDGET)):
+            with assert_max_queries(budget, url):
+                response = client.patch(url, data={'text': 'Изменено'})
+            assert response.status_code == 200, (
+                f'Проверьте, что автор может изменить объект PATCH запросом `{url}`'
+            )
+        for url, budget in ((comment_url, COMMENT_CHANGE_BUDGET), (review_url, REVIEW_CHANGE_BUDGET + 2)):
+            with assert_max_queries(budget, url):
+                response = client.delete(url)
+            assert response.status_code == 204, (
+                f'Проверьте, что автор может удалить объект DELETE запросом `{url}`'
+            )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_02_bulk_delete(self, client, admin_client, admin):
+        comments, reviews, titles, user, moderator = create_comments(admin_client, admin)
+        ids = [comment['id'] for comment in comments]
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/{reviews[0]["id"]}/comments/bulk-delete/'
+        assert client.post(url, data={'ids': ids}, format='json').status_code == 401
+        response = auth_client(user).post(url, data={'ids': ids}, format='json')
+        assert response.status_code == 200 and response.json() == {'deleted': [comments[1]['id']]}, (
+            f'Проверьте, что POST запрос `{url}` удаляет только объекты, доступные пользователю'
+        )
+        assert Comment.objects.count() == 2
+        response = auth_client(moderator).post(url, data={'ids': ids}, format='json')
+        assert response.json() == {'deleted': [comments[0]['id'], comments[2]['id']]}, (
+            f'Проверьте, что POST запрос `{url}` модератора удаляет любые объекты'
+        )
+        assert auth_client(user).post(url, data={'ids': []}, format='json').status_code == 400
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/bulk-delete/'
+        response = auth_client(user).post(url, data={'ids': [review['id'] for review in reviews]}, format='json')
+        assert response.json() == {'deleted': [reviews[1]['id']]}
+        title = Title.objects.get(pk=titles[0]['id'])
+        assert title.reviews_count == Review.objects.filter(title=title).count() == 2, (
+            f'Проверьте, что POST запрос `{url}` обновляет счётчики произведения'
+        )
+        url = '/api/v1/titles/0/reviews/bulk-delete/'
+        assert auth_client(user).post(url, data={'ids': [1]}, format='json').status_code == 404
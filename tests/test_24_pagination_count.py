@@ -0,0 +1,77 @@
+import pytest
+from api import cache
+from api.views import ReviewViewSet
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from reviews.models import Title
+
+from .common import create_reviews
+
+
+def get(client, url):
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+    assert response.status_code == 200
+    counts = [query['sql'] for query in context.captured_queries if 'COUNT(*)' in query['sql']]
+    return response.json(), counts
+
+
+class Test24PaginationCount:
+
+    @pytest.mark.django_db(transaction=True)
+    def test_01_count_none(self, client):
+        Title.objects.bulk_create(Title(name=f'Произведение {i}', year=2000) for i in range(5))
+        url = '/api/v1/titles/?count=none&limit=2'
+        data, counts = get(client, url)
+        assert 'count' not in data and not counts, (
+            f'Проверьте, что GET запрос `{url}` не считает количество объектов'
+        )
+        assert len(data['results']) == 2 and 'offset=2' in data['next'] and data['previous'] is None, (
+            f'Проверьте, что GET запрос `{url}` возвращает ссылку на следующую страницу'
+        )
+        data, _ = get(client, '/api/v1/titles/?count=none&limit=2&offset=4')
+        assert len(data['results']) == 1 and data['next'] is None and 'offset=2' in data['previous'], (
+            'Проверьте, что на последней странице без подсчёта нет ссылки на следующую страницу'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_02_count_cached(self, client, admin_client):
+        Title.objects.bulk_create(Title(name=f'Произведение {i}', year=2000) for i in range(5))
+        cache.clear()
+        data, counts = get(client, '/api/v1/titles/?limit=2')
+        assert data['count'] == 5 and len(counts) == 1
+        data, counts = get(client, '/api/v1/titles/?limit=2&offset=2')
+        assert data['count'] == 5 and not counts, (
+            'Проверьте, что количество произведений берётся из кэша для той же комбинации фильтров'
+        )
+        data, counts = get(client, '/api/v1/titles/?limit=2&year=2000')
+        assert data['count'] == 5 and len(counts) == 1, (
+            'Проверьте, что количество кэшируется отдельно для каждой комбинации фильтров'
+        )
+        Title.objects.create(name='Новое произведение', year=2000)
+        data, _ = get(client, '/api/v1/titles/?limit=2&offset=4')
+        assert data['count'] == 6, (
+            'Проверьте, что изменение произведений сбрасывает кэшированное количество'
+        )
+        data, counts = get(client, '/api/v1/titles/?limit=2&offset=2&count=exact')
+        assert data['count'] == 6 and len(counts) == 1, (
+            'Проверьте, что параметр `count=exact` включает точный подсчёт'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_03_count_mode_per_viewset(self, client, admin_client, admin, monkeypatch):
+        _, titles, _, _ = create_reviews(admin_client, admin)
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+        data, counts = get(client, url)
+        assert data['count'] == 3 and len(counts) == 1
+        monkeypatch.setattr(ReviewViewSet, 'pagination_count_mode', 'none')
+        data, counts = get(client, f'{url}?limit=2')
+        assert 'count' not in data and not counts and data['next'], (
+            'Проверьте, что режим подсчёта можно задать для вьюсета атрибутом `pagination_count_mode`'
+        )
+        data, _ = get(client, f'{url}?limit=2&count=cached')
+        assert data['count'] == 3
+        data, _ = get(client, f'{url}?cursor=&limit=2')
+        assert 'count' not in data and data['next'], (
+            'Проверьте, что пагинация по курсору работает вместе с режимами подсчёта'
+        )
@@ -0,0 +1,71 @@
+import pytest
+from django.core.management import call_command
+from reviews.models import Review, Title
+
+from .common import create_reviews, title_counters_mismatches
+
+
+class Test25TitleCounters:
+
+    @pytest.mark.django_db(transaction=True)
+    def test_01_rescore_review(self, admin_client, admin):
+        reviews, titles, _, _ = create_reviews(admin_client, admin)
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/{reviews[0]["id"]}/'
+        admin_client.patch(url, data={'score': 10})
+        title = Title.objects.get(pk=titles[0]['id'])
+        assert (title.score_sum, title.reviews_count, title.rating) == (17, 3, 17 / 3), (
+            f'Проверьте, что PATCH запрос `{url}` с новой оценкой обновляет сумму оценок и рейтинг'
+        )
+        admin_client.patch(url, data={'text': 'Без изменения оценки'})
+        review = Review.objects.get(pk=reviews[1]['id'])
+        review.title_id = titles[1]['id']
+        review.save()
+        assert not title_counters_mismatches(), (
+            'Проверьте, что перенос отзыва на другое произведение обновляет счётчики обоих произведений'
+        )
+        assert Title.objects.get(pk=titles[1]['id']).rating == 3
+
+    @pytest.mark.django_db(transaction=True)
+    def test_02_cascade_delete(self, admin_client, admin):
+        reviews, titles, user, _ = create_reviews(admin_client, admin)
+        user.delete()
+        title = Title.objects.get(pk=titles[0]['id'])
+        assert (title.score_sum, title.reviews_count, title.rating) == (9, 2, 4.5), (
+            'Проверьте, что удаление автора вместе с отзывами обновляет счётчики произведения'
+        )
+        Title.objects.get(pk=titles[0]['id']).delete()
+        assert not Review.objects.exists() and not title_counters_mismatches(), (
+            'Проверьте, что удаление произведения вместе с отзывами не ломает счётчики'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_03_recalculate_ratings(self, admin_client, admin):
+        _, titles, _, _ = create_reviews(admin_client, admin)
+        Title.objects.update(score_sum=100, reviews_count=1, rating=100)
+        call_command('recalculate_ratings')
+        assert not title_counters_mismatches(), (
+            'Проверьте, что команда `recalculate_ratings` пересчитывает счётчики по отзывам'
+        )
+        title = Title.objects.get(pk=titles[1]['id'])
+        assert (title.score_sum, title.reviews_count, title.rating) == (0, 0, None), (
+            'Проверьте, что команда `recalculate_ratings` обнуляет счётчики произведения без отзывов'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_04_stale_title_save(self, admin_client, admin):
+        reviews, titles, _, _ = create_reviews(admin_client, admin)
+        title = Title.objects.get(pk=titles[1]['id'])
+        Review.objects.create(author=admin, title=title, text='Отзыв', score=9)
+        title.name = 'Новое название'
+        title.save()
+        title = Title.objects.get(pk=titles[1]['id'])
+        assert (title.name, title.score_sum, title.reviews_count, title.rating, title.score_9) == (
+            'Новое название', 9, 1, 9, 1
+        ), (
+            'Проверьте, что сохранение устаревшего объекта произведения не затирает счётчики отзывов'
+        )
+        url = f'/api/v1/titles/{titles[0]["id"]}/'
+        admin_client.patch(url, data={'name': 'Другое название'})
+        assert not title_counters_mismatches(), (
+            f'Проверьте, что PATCH запрос `{url}` не изменяет счётчики отзывов'
+        )
@@ -0,0 +1,47 @@
+import csv
+import os
+from io import StringIO
+
+import pytest
+from django.conf import settings
+from django.core.management import call_command
+from reviews.models import Comment, Genre, Review, Title, User
+from reviews.search import search_titles
+
+from .common import title_counters_mismatches, title_ranking_mismatches
+
+DATA_PATH = os.path.join(settings.BASE_DIR, 'static/data')
+
+
+def csv_rows(filename):
+    with open(os.path.join(DATA_PATH, filename), encoding='utf-8') as csv_file:
+        return sum(1 for _ in csv.DictReader(csv_file))
+
+
+class Test26ImportData:
+
+    @pytest.mark.django_db(transaction=True)
+    def test_01_import_data(self):
+        call_command('import_data', batch_size=7, stdout=StringIO())
+        for model, filename in (
+            (User, 'users.csv'), (Genre, 'genre.csv'), (Title, 'titles.csv'),
+            (Title.genre.through, 'genre_title.csv'), (Review, 'review.csv'),
+            (Comment, 'comments.csv'),
+        ):
+            assert model.objects.count() == csv_rows(filename), (
+                f'Проверьте, что команда `import_data` загружает все строки из `{filename}`'
+            )
+        assert not title_counters_mismatches(), (
+            'Проверьте, что команда `import_data` пересчитывает рейтинг и число отзывов произведений'
+        )
+        assert not title_ranking_mismatches(), (
+            'Проверьте, что команда `import_data` пересчитывает взвешенный рейтинг произведений'
+        )
+        found = search_titles(Title.objects.all(), 'Шоушенка').values_list('name', flat=True)
+        assert list(found) == ['Побег из Шоушенка'], (
+            'Проверьте, что после команды `import_data` произведения доступны в полнотекстовом поиске'
+        )
+        last_id = Title.objects.order_by('-pk').values_list('pk', flat=True).first()
+        assert Title.objects.create(name='Новое произведение', year=2000).pk > last_id, (
+            'Проверьте, что команда `import_data` сбрасывает последовательности идентификаторов'
+        )
@@ -0,0 +1,47 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from reviews.models import Category, Comment, Genre, Review, Title, User
+
+from .common import title_counters_mismatches, title_ranking_mismatches
+
+OPTIONS = {
+    'seed': 7, 'users': 30, 'categories': 3, 'genres': 5, 'titles': 40,
+    'reviews': 200, 'comments': 100, 'batch_size': 16,
+}
+
+
+def generate():
+    first_review = (Review.objects.order_by('-id').values_list('id', flat=True).first() or 0) + 1
+    call_command('generate_data', stdout=StringIO(), **OPTIONS)
+    return sorted(Review.objects.filter(id__gte=first_review).values_list('score', flat=True))
+
+
+class Test27GenerateData:
+
+    @pytest.mark.django_db(transaction=True)
+    def test_01_generate_data(self):
+        scores = generate()
+        for model, option in (
+            (User, 'users'), (Category, 'categories'), (Genre, 'genres'),
+            (Title, 'titles'), (Comment, 'comments'),
+        ):
+            assert model.objects.count() == OPTIONS[option], (
+                f'Проверьте, что команда `generate_data` создаёт `--{option}` записей'
+            )
+        assert 0 < len(scores) <= OPTIONS['reviews'], (
+            'Проверьте, что команда `generate_data` создаёт не больше `--reviews` отзывов'
+        )
+        assert not title_counters_mismatches(), (
+            'Проверьте, что команда `generate_data` пересчитывает рейтинг и число отзывов произведений'
+        )
+        assert not title_ranking_mismatches(), (
+            'Проверьте, что команда `generate_data` пересчитывает взвешенный рейтинг произведений'
+        )
+        assert generate() == scores, (
+            'Проверьте, что команда `generate_data` с тем же `--seed` создаёт те же данные'
+        )
+        assert not title_counters_mismatches() and not title_ranking_mismatches(), (
+            'Проверьте, что повторный запуск `generate_data` дополняет данные с верными счётчиками'
+        )
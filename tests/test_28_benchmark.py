@@ -0,0 +1,45 @@
+import json
+from contextlib import nullcontext
+from io import StringIO
+
+import pytest
+from api.management.commands.benchmark import METRICS, Command
+from django.core.management import CommandError, call_command
+
+OPTIONS = {
+    'iterations': 2, 'users': 20, 'titles': 20, 'reviews': 60,
+    'comments': 30, 'seed': 7,
+}
+SCENARIOS = (
+    'titles-list', 'titles-filter', 'titles-search', 'title-detail',
+    'title-create', 'reviews-list', 'reviews-cursor', 'review-create',
+    'review-update', 'review-delete', 'comments-list', 'comment-create',
+    'comment-update', 'comment-delete', 'signup', 'token',
+)
+
+
+class Test28Benchmark:
+
+    @pytest.fixture(autouse=True)
+    def current_database(self, monkeypatch):
+        monkeypatch.setattr(Command, 'test_database', nullcontext)
+
+    @pytest.mark.django_db(transaction=True)
+    def test_01_benchmark_smoke(self, tmp_path):
+        baseline = tmp_path / 'baseline.json'
+        call_command('benchmark', baseline=str(baseline), save_baseline=True, stdout=StringIO(), **OPTIONS)
+        results = json.loads(baseline.read_text())
+        assert sorted(results) == sorted(SCENARIOS), (
+            'Проверьте, что команда `benchmark` выполняет все сценарии'
+        )
+        for name, result in results.items():
+            assert set(result) == set(METRICS), (
+                f'Проверьте, что команда `benchmark` сохраняет все метрики сценария `{name}`'
+            )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_02_benchmark_regression(self, tmp_path):
+        baseline = tmp_path / 'baseline.json'
+        baseline.write_text(json.dumps({'titles-list': {'p95': 1000000, 'queries': 0}}))
+        with pytest.raises(CommandError, match='titles-list: .* queries > 0 baseline'):
+            call_command('benchmark', baseline=str(baseline), scenario=['titles-list'], stdout=StringIO(), **OPTIONS)